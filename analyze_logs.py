@@ -8,11 +8,33 @@ import os
 import re
 import ast
 import sys
+import mmap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import simdjson
+    # A single parser is reused for every line; recursive=True materializes
+    # plain dicts so entries stay valid after the next parse() call.
+    _simdjson_parser = simdjson.Parser()
+    json_loads = lambda raw: _simdjson_parser.parse(raw, recursive=True)
+except ImportError:
+    try:
+        import orjson
+        json_loads = orjson.loads
+    except ImportError:
+        import json
+        json_loads = json.loads
+
 LOG_DIR = Path("logs")
 
+# Only lines mentioning one of these can affect the summary
+CANDIDATE_RE = re.compile(rb'PAPER_TRADE_EXECUTED|SYSTEM_ERROR|POLICY_VIOLATION')
+
+# Below this total size, rotated files are scanned serially
+PARALLEL_MIN_BYTES = 1 << 20
+
 def find_latest_log():
     if not LOG_DIR.exists():
         return None
@@ -22,49 +44,125 @@ def find_latest_log():
     # Sort by name (which includes timestamp)
     return sorted(files)[-1]
 
+# "YYYY-MM-DD HH:MM:SS" prefix is fixed width, followed by " | "
+TIMESTAMP_LEN = 19
+SEPARATOR = " | "
+SEPARATOR_BYTES = b" | "
+
 def parse_log_line(line):
-    # Format: YYYY-MM-DD HH:MM:SS | INFO | {json-like dict}
+    # Format: YYYY-MM-DD HH:MM:SS | INFO | {json dict}
+    # Accepts str or raw bytes; bytes go to the JSON parser undecoded.
     try:
-        parts = line.split(" | ", 2)
-        if len(parts) < 3:
+        sep = SEPARATOR_BYTES if isinstance(line, bytes) else SEPARATOR
+        # Slice by offset instead of split(): no intermediate list
+        if not line.startswith(sep, TIMESTAMP_LEN):
+            return None
+        payload_sep = line.find(sep, TIMESTAMP_LEN + len(sep))
+        if payload_sep == -1:
             return None
         
-        timestamp_str = parts[0]
-        # details part is a string representation of a dict
-        details_str = parts[2].strip()
+        timestamp_str = line[:TIMESTAMP_LEN]
+        details_str = line[payload_sep + len(sep):]
+        if isinstance(timestamp_str, bytes):
+            timestamp_str = timestamp_str.decode('ascii')
         
-        # safely evaluate the dict string
-        data = ast.literal_eval(details_str)
+        try:
+            data = json_loads(details_str)
+        except ValueError:
+            # Legacy logs (pre-JSON) store the repr of a dict
+            if isinstance(details_str, bytes):
+                details_str = details_str.decode('utf-8', errors='replace')
+            data = ast.literal_eval(details_str.strip())
         return {"timestamp": timestamp_str, "data": data}
     except Exception:
         return None
 
+def iter_candidate_lines(log_file):
+    """
+    Yield (as raw bytes) only the log lines that contain a candidate marker.
+    The file is memory-mapped and scanned with a compiled regex, so the
+    bulk of irrelevant lines is never decoded or JSON-parsed.
+    """
+    with open(log_file, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # Empty file cannot be mapped
+        with mm:
+            pos = 0
+            while True:
+                match = CANDIDATE_RE.search(mm, pos)
+                if match is None:
+                    return
+                line_start = mm.rfind(b'\n', 0, match.start()) + 1
+                line_end = mm.find(b'\n', match.end())
+                if line_end == -1:
+                    line_end = len(mm)
+                yield mm[line_start:line_end]
+                pos = line_end + 1
+
+def find_session_logs(log_file):
+    """Return the rotated backups of log_file (oldest first), then log_file."""
+    log_file = Path(log_file)
+    backups = [
+        p for p in log_file.parent.glob(log_file.name + ".*")
+        if p.suffix[1:].isdigit()
+    ]
+    # RotatingFileHandler: .1 is the most recent backup, .N the oldest
+    backups.sort(key=lambda p: int(p.suffix[1:]), reverse=True)
+    return backups + [log_file]
+
+def scan_log_file(log_file):
+    """Collect paper trades and the error/violation count from one file."""
+    trades = []
+    errors = 0
+    
+    for line in iter_candidate_lines(log_file):
+        entry = parse_log_line(line)
+        if not entry:
+            continue
+            
+        data = entry["data"]
+        event_type = data.get("type")
+        action = data.get("action")
+        details = data.get("details", {})
+        
+        if action == "PAPER_TRADE_EXECUTED":
+            trades.append({
+                "time": entry["timestamp"],
+                "strategy": details.get("strategy", "Unknown"),
+                "order_id": details.get("order_id"),
+                "params": details.get("params", {})
+            })
+        elif event_type == "SYSTEM_ERROR" or event_type == "POLICY_VIOLATION":
+            errors += 1
+    
+    return trades, errors
+
 def analyze_logs(log_file):
     print(f"📊 Analyzing log file: {log_file}")
     
+    files = find_session_logs(log_file)
+    if len(files) > 1:
+        print(f"   (+ {len(files) - 1} rotated backup(s))")
+    
+    # Process start-up only pays off once there is real volume to parse.
+    # Processes rather than threads: parsing is pure Python and GIL-bound.
+    # Workers receive only a Path and return (trades, errors), and every
+    # pattern is rebuilt at import, so spawn (macOS/Windows) behaves the same
+    # as fork; the __main__ guard below keeps workers from re-running main.
+    total_bytes = sum(f.stat().st_size for f in files)
+    if len(files) > 1 and total_bytes >= PARALLEL_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(scan_log_file, files))
+    else:
+        results = [scan_log_file(f) for f in files]
+    
     trades = []
     errors = 0
-    
-    with open(log_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            entry = parse_log_line(line)
-            if not entry:
-                continue
-                
-            data = entry["data"]
-            event_type = data.get("type")
-            action = data.get("action")
-            details = data.get("details", {})
-            
-            if action == "PAPER_TRADE_EXECUTED":
-                trades.append({
-                    "time": entry["timestamp"],
-                    "strategy": details.get("strategy", "Unknown"),
-                    "order_id": details.get("order_id"),
-                    "params": details.get("params", {})
-                })
-            elif event_type == "SYSTEM_ERROR" or event_type == "POLICY_VIOLATION":
-                errors += 1
+    for file_trades, file_errors in results:
+        trades.extend(file_trades)
+        errors += file_errors
                 
     # Summary
     print(f"\n--- 📝 Paper Trading Summary ---")
@@ -77,26 +175,27 @@ def analyze_logs(log_file):
 
     print(f"\n--- 📋 Trade Details ---")
     
+    # strategy -> [trade count, notional volume], filled in the same pass
     by_strategy = {}
     
     for t in trades:
         strat = t["strategy"]
-        if strat not in by_strategy:
-            by_strategy[strat] = []
-        by_strategy[strat].append(t)
-        
         params = t["params"]
         side = params.get("side", "BUY")
         size = float(params.get("size", 0))
         price = float(params.get("price", 0))
         token = params.get("token_id", "???")[:10] + "..."
         
+        totals = by_strategy.get(strat)
+        if totals is None:
+            totals = by_strategy[strat] = [0, 0.0]
+        totals[0] += 1
+        totals[1] += size * price
+        
         print(f"[{t['time']}] {strat} | {side} {size} @ {price} | Token: {token}")
 
     print(f"\n--- 📈 Strategy Breakdown ---")
-    for strat, t_list in by_strategy.items():
-        count = len(t_list)
-        total_vol = sum(float(t["params"].get("size", 0)) * float(t["params"].get("price", 0)) for t in t_list)
+    for strat, (count, total_vol) in by_strategy.items():
         print(f"{strat}: {count} trades | Est. Volume: ${total_vol:.2f}")
 
 if __name__ == "__main__":
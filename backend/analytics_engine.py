@@ -15,12 +15,14 @@ import time
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from collections import deque
+from itertools import islice
+from operator import itemgetter
 import math
 
 from .audit_logger import AuditLogger
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeMetric:
     """Single trade for analytics tracking."""
     trade_id: str
@@ -35,7 +37,18 @@ class TradeMetric:
     is_winner: bool
 
 
-@dataclass
+@dataclass(slots=True)
+class StrategyTotals:
+    """Running per-strategy aggregates, updated on every recorded trade."""
+    count: int = 0
+    winners: int = 0
+    total_pnl: float = 0.0
+    total_hold_time: float = 0.0
+    best_trade: float = -math.inf
+    worst_trade: float = math.inf
+
+
+@dataclass(slots=True)
 class PerformanceSnapshot:
     """Point-in-time performance snapshot."""
     timestamp: float
@@ -50,17 +63,38 @@ class AnalyticsEngine:
     Real-time analytics and performance tracking.
     """
 
+    # Rolling window (in trades) tracked incrementally for the Sharpe ratio
+    SHARPE_WINDOW = 100
+
+    # Annualization (assuming ~250 trading days, ~10 trades per day)
+    TRADES_PER_YEAR = 250 * 10
+    _ANNUALIZATION_FACTOR = math.sqrt(TRADES_PER_YEAR)
+
+    # Rolling window (in equity points) for the windowed drawdown
+    ROLLING_DRAWDOWN_WINDOW = 500
+
     def __init__(self, audit_logger: AuditLogger, initial_capital: float = 1000.0):
         self._audit = audit_logger
         self._initial_capital = initial_capital
         self._current_equity = initial_capital
 
-        # Trade history
-        self._trades: List[TradeMetric] = []
-        self._trades_by_strategy: Dict[str, List[TradeMetric]] = {}
+        # Recent trade history: aggregates live in the running totals below,
+        # so only the tail read by get_recent_trades is kept in memory.
+        self._trades: deque = deque(maxlen=1000)
+
+        # Running aggregates so every metric query is O(1)
+        self._gross_profit = 0.0
+        self._gross_loss = 0.0
+        self._strategy_totals: Dict[str, StrategyTotals] = {}
 
         # Rolling windows for calculations
         self._pnl_history: deque = deque(maxlen=1000)  # Last 1000 PnL points
+
+        # Welford mean / M2 over the last SHARPE_WINDOW PnL points
+        self._window_n = 0
+        self._window_mean = 0.0
+        self._window_m2 = 0.0
+
         self._equity_history: deque = deque(maxlen=10000)  # Equity curve
 
         # Performance tracking
@@ -68,8 +102,13 @@ class AnalyticsEngine:
         self._max_drawdown = 0.0
         self._max_drawdown_pct = 0.0
 
+        # Monotonic deque of (equity, index): front is the rolling-window peak
+        self._window_peaks: deque = deque()
+        self._equity_index = 0
+        self._push_window_equity(initial_capital)
+
         # Session stats
-        self._session_start = time.time()
+        self._session_start = time.monotonic()
         self._total_pnl = 0.0
         self._total_trades = 0
         self._winning_trades = 0
@@ -78,6 +117,9 @@ class AnalyticsEngine:
         # Risk-free rate for Sharpe (annualized, ~5% = 0.05)
         self._risk_free_rate = 0.05
 
+        # Rounded summary, invalidated whenever the underlying metrics change
+        self._summary_cache: Optional[dict] = None
+
         # Initialize with starting point
         self._equity_history.append(PerformanceSnapshot(
             timestamp=time.time(),
@@ -102,11 +144,13 @@ class AnalyticsEngine:
         pnl = (exit_price - entry_price) * size
         pnl_pct = ((exit_price / entry_price) - 1) * 100 if entry_price > 0 else 0
         is_winner = pnl > 0
+        now = time.time()
+        self._summary_cache = None
 
         trade = TradeMetric(
             trade_id=trade_id,
             strategy=strategy,
-            timestamp=time.time(),
+            timestamp=now,
             entry_price=entry_price,
             exit_price=exit_price,
             size=size,
@@ -118,28 +162,40 @@ class AnalyticsEngine:
 
         # Update tracking
         self._trades.append(trade)
-        if strategy not in self._trades_by_strategy:
-            self._trades_by_strategy[strategy] = []
-        self._trades_by_strategy[strategy].append(trade)
+
+        totals = self._strategy_totals.get(strategy)
+        if totals is None:
+            totals = self._strategy_totals[strategy] = StrategyTotals()
+        totals.count += 1
+        totals.total_pnl += pnl
+        totals.total_hold_time += hold_time_sec
+        if pnl > totals.best_trade:
+            totals.best_trade = pnl
+        if pnl < totals.worst_trade:
+            totals.worst_trade = pnl
 
         # Update statistics
-        self._total_pnl += pnl
+        total_pnl = self._total_pnl = self._total_pnl + pnl
         self._total_trades += 1
         if is_winner:
             self._winning_trades += 1
+            self._gross_profit += pnl
+            totals.winners += 1
         else:
             self._losing_trades += 1
+            self._gross_loss -= pnl
 
         # Update equity and drawdown
-        self._current_equity += pnl
-        self._pnl_history.append(pnl)
+        equity = self._current_equity = self._current_equity + pnl
+        self._update_return_window(pnl)
         self._update_drawdown()
+        self._push_window_equity(equity)
 
         # Record snapshot
         self._equity_history.append(PerformanceSnapshot(
-            timestamp=time.time(),
-            total_pnl=self._total_pnl,
-            equity=self._current_equity,
+            timestamp=now,
+            total_pnl=total_pnl,
+            equity=equity,
             drawdown=self._max_drawdown,
             drawdown_pct=self._max_drawdown_pct
         ))
@@ -158,6 +214,51 @@ class AnalyticsEngine:
             self._max_drawdown = current_drawdown
             self._max_drawdown_pct = current_drawdown_pct
 
+    def _push_window_equity(self, equity: float) -> None:
+        """Add an equity point to the rolling-peak deque (amortized O(1))."""
+        peaks = self._window_peaks
+        while peaks and peaks[-1][0] <= equity:
+            peaks.pop()
+        peaks.append((equity, self._equity_index))
+
+        # Drop the peak once it slides out of the window
+        if self._equity_index - peaks[0][1] >= self.ROLLING_DRAWDOWN_WINDOW:
+            peaks.popleft()
+        self._equity_index += 1
+
+    def calculate_rolling_drawdown(self) -> tuple[float, float]:
+        """
+        Drawdown of current equity from the peak of the last
+        ROLLING_DRAWDOWN_WINDOW equity points, as (amount, pct).
+        """
+        if not self._window_peaks:
+            return 0.0, 0.0
+
+        peak = self._window_peaks[0][0]
+        drawdown = peak - self._current_equity
+        drawdown_pct = (drawdown / peak * 100) if peak > 0 else 0.0
+        return drawdown, drawdown_pct
+
+    def _update_return_window(self, pnl: float) -> None:
+        """Append a PnL point and slide the Welford window over it."""
+        history = self._pnl_history
+        if len(history) >= self.SHARPE_WINDOW:
+            # Evict the point leaving the window (reverse Welford update)
+            old = history[-self.SHARPE_WINDOW]
+            n = self._window_n - 1
+            delta = old - self._window_mean
+            self._window_mean -= delta / n
+            self._window_m2 -= delta * (old - self._window_mean)
+            self._window_n = n
+
+        history.append(pnl)
+
+        n = self._window_n + 1
+        delta = pnl - self._window_mean
+        self._window_mean += delta / n
+        self._window_m2 += delta * (pnl - self._window_mean)
+        self._window_n = n
+
     def calculate_sharpe_ratio(self, period_trades: int = 100) -> float:
         """
         Calculate Sharpe Ratio based on recent trades.
@@ -166,27 +267,33 @@ class AnalyticsEngine:
         if len(self._pnl_history) < 2:
             return 0.0
 
-        recent_pnls = list(self._pnl_history)[-period_trades:]
-
-        if len(recent_pnls) < 2:
+        if period_trades == self.SHARPE_WINDOW:
+            count = self._window_n
+            avg_return = self._window_mean
+            m2 = self._window_m2
+        else:
+            # Single-pass Welford over the most recent points
+            count, avg_return, m2 = 0, 0.0, 0.0
+            for pnl in islice(reversed(self._pnl_history), max(period_trades, 0)):
+                count += 1
+                delta = pnl - avg_return
+                avg_return += delta / count
+                m2 += delta * (pnl - avg_return)
+
+        if count < 2:
             return 0.0
 
-        avg_return = sum(recent_pnls) / len(recent_pnls)
-        std_return = math.sqrt(
-            sum((pnl - avg_return) ** 2 for pnl in recent_pnls) / len(recent_pnls)
-        )
+        std_return = math.sqrt(max(m2, 0.0) / count)
 
-        if std_return == 0:
+        # Treat float residue from the sliding updates as zero variance
+        if std_return < 1e-12:
             return 0.0
 
-        # Annualize (assuming ~250 trading days, ~10 trades per day)
-        annualization_factor = math.sqrt(250 * 10)
-
         # Calculate excess return (subtract risk-free rate per trade)
-        rfr_per_trade = self._risk_free_rate / (250 * 10)
+        rfr_per_trade = self._risk_free_rate / self.TRADES_PER_YEAR
         excess_return = avg_return - rfr_per_trade
 
-        sharpe = (excess_return / std_return) * annualization_factor
+        sharpe = (excess_return / std_return) * self._ANNUALIZATION_FACTOR
 
         return round(sharpe, 2)
 
@@ -194,8 +301,8 @@ class AnalyticsEngine:
         """
         Calculate Profit Factor = Gross Profit / Gross Loss
         """
-        gross_profit = sum(t.pnl for t in self._trades if t.pnl > 0)
-        gross_loss = abs(sum(t.pnl for t in self._trades if t.pnl < 0))
+        gross_profit = self._gross_profit
+        gross_loss = self._gross_loss
 
         if gross_loss == 0:
             return float('inf') if gross_profit > 0 else 0.0
@@ -210,14 +317,14 @@ class AnalyticsEngine:
         if self._total_trades == 0:
             return 0.0
 
-        winning = [t for t in self._trades if t.pnl > 0]
-        losing = [t for t in self._trades if t.pnl <= 0]
+        winning = self._winning_trades
+        losing = self._losing_trades
 
-        win_rate = len(winning) / self._total_trades
-        loss_rate = len(losing) / self._total_trades
+        win_rate = winning / self._total_trades
+        loss_rate = losing / self._total_trades
 
-        avg_win = sum(t.pnl for t in winning) / len(winning) if winning else 0
-        avg_loss = abs(sum(t.pnl for t in losing) / len(losing)) if losing else 0
+        avg_win = self._gross_profit / winning if winning else 0
+        avg_loss = self._gross_loss / losing if losing else 0
 
         ev = (win_rate * avg_win) - (loss_rate * avg_loss)
 
@@ -225,9 +332,9 @@ class AnalyticsEngine:
 
     def get_strategy_stats(self, strategy: str) -> dict:
         """Get statistics for a specific strategy."""
-        trades = self._trades_by_strategy.get(strategy, [])
+        totals = self._strategy_totals.get(strategy)
 
-        if not trades:
+        if not totals:
             return {
                 'total_trades': 0,
                 'win_rate': 0,
@@ -236,28 +343,47 @@ class AnalyticsEngine:
                 'avg_hold_time': 0
             }
 
-        winners = [t for t in trades if t.is_winner]
-        total_pnl = sum(t.pnl for t in trades)
+        count = totals.count
+        winners = totals.winners
+        total_pnl = totals.total_pnl
 
         return {
-            'total_trades': len(trades),
-            'winning_trades': len(winners),
-            'losing_trades': len(trades) - len(winners),
-            'win_rate': round(len(winners) / len(trades) * 100, 1),
+            'total_trades': count,
+            'winning_trades': winners,
+            'losing_trades': count - winners,
+            'win_rate': round(winners / count * 100, 1),
             'total_pnl': round(total_pnl, 4),
-            'avg_pnl': round(total_pnl / len(trades), 4),
-            'avg_hold_time': round(sum(t.hold_time_sec for t in trades) / len(trades), 1),
-            'best_trade': round(max(t.pnl for t in trades), 4),
-            'worst_trade': round(min(t.pnl for t in trades), 4)
+            'avg_pnl': round(total_pnl / count, 4),
+            'avg_hold_time': round(totals.total_hold_time / count, 1),
+            'best_trade': round(totals.best_trade, 4),
+            'worst_trade': round(totals.worst_trade, 4)
         }
 
     def get_summary(self) -> dict:
-        """Get comprehensive performance summary."""
-        runtime_hours = (time.time() - self._session_start) / 3600
+        """
+        Get comprehensive performance summary.
+        The rounded metrics only change when a trade is recorded, so they are
+        cached between trades and only the session runtime is refreshed.
+        """
+        if self._summary_cache is None:
+            self._summary_cache = self._build_summary()
+
+        # Copy both levels so a caller editing its result cannot corrupt the cache
+        summary = dict(self._summary_cache)
+        summary['strategies'] = {
+            strategy: dict(stats) for strategy, stats in summary['strategies'].items()
+        }
+        runtime_hours = (time.monotonic() - self._session_start) / 3600
+        summary['session_runtime_hours'] = round(runtime_hours, 2)
+        return summary
+
+    def _build_summary(self) -> dict:
+        """Compute the trade-dependent part of the summary."""
+        rolling_drawdown, rolling_drawdown_pct = self.calculate_rolling_drawdown()
 
         return {
             # Overview
-            'session_runtime_hours': round(runtime_hours, 2),
+            'session_runtime_hours': 0.0,
             'initial_capital': self._initial_capital,
             'current_equity': round(self._current_equity, 2),
             'total_pnl': round(self._total_pnl, 4),
@@ -275,6 +401,8 @@ class AnalyticsEngine:
             'max_drawdown': round(self._max_drawdown, 4),
             'max_drawdown_pct': round(self._max_drawdown_pct, 2),
             'peak_equity': round(self._peak_equity, 2),
+            'rolling_drawdown': round(rolling_drawdown, 4),
+            'rolling_drawdown_pct': round(rolling_drawdown_pct, 2),
 
             # Performance Metrics
             'sharpe_ratio': self.calculate_sharpe_ratio(),
@@ -287,44 +415,33 @@ class AnalyticsEngine:
             # Strategy Breakdown
             'strategies': {
                 strategy: self.get_strategy_stats(strategy)
-                for strategy in self._trades_by_strategy.keys()
+                for strategy in self._strategy_totals.keys()
             }
         }
 
     def get_equity_curve(self, points: int = 100) -> List[dict]:
         """Get equity curve data for charting."""
-        history = list(self._equity_history)
-
-        if len(history) <= points:
-            return [
-                {
-                    'timestamp': s.timestamp,
-                    'equity': s.equity,
-                    'pnl': s.total_pnl,
-                    'drawdown_pct': s.drawdown_pct
-                }
-                for s in history
-            ]
-
-        # Sample evenly
-        step = len(history) / points
-        sampled = []
-        for i in range(points):
-            idx = int(i * step)
-            s = history[idx]
-            sampled.append({
+        history = self._equity_history
+        size = len(history)
+
+        if size > points:
+            # Sample evenly: gather only the picked snapshots in one C-level call
+            step = size / points
+            picked = itemgetter(*[int(i * step) for i in range(points)])(list(history))
+            history = picked if points > 1 else (picked,)
+
+        return [
+            {
                 'timestamp': s.timestamp,
                 'equity': s.equity,
                 'pnl': s.total_pnl,
                 'drawdown_pct': s.drawdown_pct
-            })
-
-        return sampled
+            }
+            for s in history
+        ]
 
     def get_recent_trades(self, limit: int = 20) -> List[dict]:
         """Get most recent trades."""
-        recent = self._trades[-limit:] if len(self._trades) >= limit else self._trades
-
         return [
             {
                 'trade_id': t.trade_id,
@@ -335,25 +452,34 @@ class AnalyticsEngine:
                 'hold_time_sec': round(t.hold_time_sec, 1),
                 'is_winner': t.is_winner
             }
-            for t in reversed(recent)
+            for t in islice(reversed(self._trades), max(limit, 0))
         ]
 
     def reset(self) -> None:
         """Reset all analytics (for new session)."""
         self._trades.clear()
-        self._trades_by_strategy.clear()
+        self._gross_profit = 0.0
+        self._gross_loss = 0.0
+        self._strategy_totals.clear()
         self._pnl_history.clear()
+        self._window_n = 0
+        self._window_mean = 0.0
+        self._window_m2 = 0.0
         self._equity_history.clear()
 
         self._current_equity = self._initial_capital
         self._peak_equity = self._initial_capital
         self._max_drawdown = 0.0
         self._max_drawdown_pct = 0.0
+        self._window_peaks.clear()
+        self._equity_index = 0
+        self._push_window_equity(self._initial_capital)
         self._total_pnl = 0.0
         self._total_trades = 0
         self._winning_trades = 0
         self._losing_trades = 0
-        self._session_start = time.time()
+        self._session_start = time.monotonic()
+        self._summary_cache = None
 
         self._audit.log_system_event("ANALYTICS_RESET")
 
@@ -362,4 +488,7 @@ class AnalyticsEngine:
         self._initial_capital = capital
         self._current_equity = capital + self._total_pnl
         self._peak_equity = max(self._peak_equity, self._current_equity)
+        self._window_peaks.clear()
+        self._push_window_equity(self._current_equity)
+        self._summary_cache = None
         self._audit.log_system_event("ANALYTICS_CAPITAL_SET", {"capital": capital})
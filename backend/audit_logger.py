@@ -7,12 +7,22 @@ v3.0: Added log rotation and disk space protection.
 """
 
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import atexit
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
 from typing import Any
 import os
+import re
+
+try:
+    import orjson
+    json_serialize = lambda x: orjson.dumps(x, default=str).decode()
+except ImportError:
+    import json
+    json_serialize = lambda x: json.dumps(x, default=str)
 
 
 class EventType(Enum):
@@ -26,6 +36,26 @@ class EventType(Enum):
     SYSTEM_ERROR = "SYSTEM_ERROR"
 
 
+# Enum .value goes through a descriptor; resolve it once per member
+_EVENT_VALUES = {event: event.value for event in EventType}
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp within the same second."""
+
+    def __init__(self, fmt: str | None = None, datefmt: str | None = None):
+        super().__init__(fmt, datefmt)
+        self._cached_second = -1
+        self._cached_time = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
+
+
 class AuditLogger:
     """
     Write-only audit logger with rotation.
@@ -49,6 +79,8 @@ class AuditLogger:
         self._logger = logging.getLogger("audit")
         self._logger.setLevel(logging.INFO)
         self._logger.handlers.clear()
+        # Records go only to the audit file, never again via the root logger
+        self._logger.propagate = False
 
         # v3.0: Use RotatingFileHandler for automatic rotation
         file_handler = RotatingFileHandler(
@@ -59,13 +91,20 @@ class AuditLogger:
         )
         file_handler.setLevel(logging.INFO)
 
-        formatter = logging.Formatter(
+        formatter = _CachedTimeFormatter(
             '%(asctime)s | %(levelname)s | %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(formatter)
 
-        self._logger.addHandler(file_handler)
+        # Callers only enqueue records; a background listener thread does
+        # the formatting, disk writes and rotation checks.
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._logger.addHandler(QueueHandler(self._queue))
+        self._file_handler = file_handler
+        self._listener = QueueListener(self._queue, file_handler, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self.close)
 
         self.log(EventType.OPERATOR_ACTION, "AUDIT_LOGGER_INITIALIZED", {
             "log_file": str(self._log_file)
@@ -91,23 +130,27 @@ class AuditLogger:
 
         except Exception as e:
             print(f"[AuditLogger] Cleanup error: {e}")
-    
-    import re
+
     _HEX_64_RE = re.compile(r'([0-9a-fA-F]{64})')
+    _SENSITIVE_KEY_RE = re.compile(
+        r'api_key|secret|private_key|password|token|credential|passphrase|vault',
+        re.IGNORECASE
+    )
     _REDACTED = "***REDACTED***"
     _MAX_STRING_LEN = 1000
 
     def log(self, event_type: EventType, action: str, details: dict[str, Any] | None = None) -> None:
         """
         Log an auditable event with automated redaction.
+        Entries are written as one JSON object per line.
         """
         redacted_details = self._redact(details) if details else {}
         entry = {
-            "type": event_type.value,
+            "type": _EVENT_VALUES[event_type],
             "action": action,
             "details": redacted_details
         }
-        self._logger.info(f"{entry}")
+        self._logger.info(json_serialize(entry))
 
     def _redact(self, data: Any) -> Any:
         """Recursively redact sensitive information."""
@@ -127,12 +170,7 @@ class AuditLogger:
 
     def _is_sensitive_key(self, key: str) -> bool:
         """Check if a dictionary key likely contains sensitive data."""
-        sensitive_patterns = {
-            "api_key", "secret", "private_key", "password", 
-            "token", "credential", "passphrase", "vault"
-        }
-        key_lower = key.lower()
-        return any(pattern in key_lower for pattern in sensitive_patterns)
+        return self._SENSITIVE_KEY_RE.search(key) is not None
     
     def log_operator_action(self, action: str, details: dict[str, Any] | None = None) -> None:
         """Log an operator-initiated action."""
@@ -184,6 +222,14 @@ class AuditLogger:
         """Log a system-level event."""
         self.log(EventType.OPERATOR_ACTION, action, details)
     
+    def close(self) -> None:
+        """Flush queued records to disk and stop the writer thread."""
+        listener = self._listener
+        if listener is not None:
+            self._listener = None
+            listener.stop()
+            self._file_handler.close()
+
     @property
     def log_file_path(self) -> str:
         """Path to current log file."""
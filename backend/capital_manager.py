@@ -4,11 +4,21 @@ Manages capital pools with atomic locking mechanism.
 Prevents double-allocation between strategies.
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable
+from typing import Callable, Iterator
+import atexit
+import queue
 import threading
 
+try:
+    # C-level lock, much cheaper for the (usual) uncontended acquire
+    from fastrlock.rlock import FastRLock as _Lock
+except ImportError:
+    # Reentrant like FastRLock, so nesting behaves the same either way
+    _Lock = threading.RLock
+
 from .audit_logger import AuditLogger
 
 
@@ -20,9 +30,9 @@ class CapitalPool(Enum):
     FREE = "free"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CapitalState:
-    """Current state of all capital pools."""
+    """Current state of all capital pools (immutable snapshot)."""
     total: float
     locked_a: float
     locked_b: float
@@ -34,6 +44,80 @@ class CapitalAllocationError(Exception):
     pass
 
 
+class _NotificationDispatcher:
+    """
+    Delivers capital notifications on a single background thread, so slow
+    subscribers never lengthen the mutating (strategy) thread's path.
+    Backlogged notifications are coalesced: latest state wins per manager.
+    Whatever is still queued at interpreter exit is delivered before exit.
+    """
+    
+    # Max time the exit hook waits for the backlog to be delivered
+    EXIT_FLUSH_TIMEOUT = 2.0
+    
+    def __init__(self):
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+    
+    def submit(self, owner: "CapitalManager", state: CapitalState, subscribers: tuple) -> None:
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="CapitalNotify", daemon=True
+                    )
+                    self._thread.start()
+                    atexit.register(self._flush_at_exit)
+        self._queue.put_nowait((owner, state, subscribers))
+    
+    def _flush_at_exit(self) -> None:
+        """Stop the thread once the backlog has been delivered."""
+        self._queue.put_nowait(None)
+        self._thread.join(self.EXIT_FLUSH_TIMEOUT)
+    
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            latest = {}
+            item = self._queue.get()
+            while True:
+                if item is None:
+                    stopping = True
+                else:
+                    latest[id(item[0])] = item
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            for owner, state, subscribers in latest.values():
+                for callback in subscribers:
+                    try:
+                        callback(state)
+                    except Exception as e:
+                        owner._audit.log_error(
+                            "CAPITAL_SUBSCRIBER_ERROR",
+                            f"{getattr(callback, '__qualname__', callback)}: {type(e).__name__}: {e}"
+                        )
+
+
+_dispatcher = _NotificationDispatcher()
+
+
+# Pools are tracked internally in integer micro-units (1e-6 USD) so
+# accounting is exact; floats only appear at the API boundary.
+SCALE = 1_000_000
+
+
+def _to_units(amount: float) -> int:
+    return int(round(amount * SCALE))
+
+
+def _from_units(units: int) -> float:
+    return units / SCALE
+
+
 class CapitalManager:
     """
     Manages capital pools with atomic locking.
@@ -43,18 +127,27 @@ class CapitalManager:
     - locked_a: Capital locked for Strategy A (Dutching)
     - locked_b: Capital locked for Strategy B (Market Making)
     - free: Available for allocation (total - locked_a - locked_b)
+    
+    All pool fields are integer micro-units (see SCALE).
     """
     
     def __init__(self, total_capital: float, max_a: float, max_b: float, audit_logger: AuditLogger):
-        self._total = total_capital
-        self._max_a = max_a
-        self._max_b = max_b
-        self._locked_a = 0.0
-        self._locked_b = 0.0
+        self._total = _to_units(total_capital)
+        self._max_a = _to_units(max_a)
+        self._max_b = _to_units(max_b)
+        self._locked_a = 0
+        self._locked_b = 0
+        # Cached total - locked_a - locked_b, refreshed on every pool mutation
+        self._free = self._total
         self._audit = audit_logger
         
-        self._lock = threading.Lock()
-        self._subscribers: list[Callable[[CapitalState], None]] = []
+        self._lock = _Lock()
+        # Copy-on-write tuple: notifications snapshot it without copying
+        self._subscribers: tuple[Callable[[CapitalState], None], ...] = ()
+        
+        # Notification batching (see batch())
+        self._batch_depth = 0
+        self._batch_dirty = False
         
         self._audit.log_capital_change("total", 0, total_capital, "INITIALIZATION")
     
@@ -66,23 +159,24 @@ class CapitalManager:
         with self._lock:
             if amount <= 0:
                 raise CapitalAllocationError("Lock amount must be positive")
+            units = _to_units(amount)
             
-            if amount > self._max_a:
+            if units > self._max_a:
                 self._audit.log_policy_violation(
                     "LOCK_STRATEGY_A",
-                    f"Amount {amount} exceeds max allocation {self._max_a}"
+                    f"Amount {amount} exceeds max allocation {self.max_a}"
                 )
                 return False
             
-            new_locked_a = self._locked_a + amount
+            new_locked_a = self._locked_a + units
             if new_locked_a > self._max_a:
                 self._audit.log_policy_violation(
                     "LOCK_STRATEGY_A",
-                    f"Total locked would exceed max: {new_locked_a} > {self._max_a}"
+                    f"Total locked would exceed max: {_from_units(new_locked_a)} > {self.max_a}"
                 )
                 return False
             
-            if amount > self.free:
+            if units > self._free:
                 self._audit.log_policy_violation(
                     "LOCK_STRATEGY_A",
                     f"Insufficient free capital: {amount} > {self.free}"
@@ -91,10 +185,15 @@ class CapitalManager:
             
             old_locked = self._locked_a
             self._locked_a = new_locked_a
+            self._update_free()
             
-            self._audit.log_capital_change("locked_a", old_locked, self._locked_a, "LOCK_STRATEGY_A")
-            self._notify_subscribers()
-            return True
+            self._audit.log_capital_change(
+                "locked_a", _from_units(old_locked), self.locked_a, "LOCK_STRATEGY_A"
+            )
+            pending = self._prepare_notification()
+        
+        self._notify_subscribers(pending)
+        return True
     
     def lock_for_strategy_b(self, amount: float) -> bool:
         """
@@ -104,23 +203,24 @@ class CapitalManager:
         with self._lock:
             if amount <= 0:
                 raise CapitalAllocationError("Lock amount must be positive")
+            units = _to_units(amount)
             
-            if amount > self._max_b:
+            if units > self._max_b:
                 self._audit.log_policy_violation(
                     "LOCK_STRATEGY_B",
-                    f"Amount {amount} exceeds max allocation {self._max_b}"
+                    f"Amount {amount} exceeds max allocation {self.max_b}"
                 )
                 return False
             
-            new_locked_b = self._locked_b + amount
+            new_locked_b = self._locked_b + units
             if new_locked_b > self._max_b:
                 self._audit.log_policy_violation(
                     "LOCK_STRATEGY_B",
-                    f"Total locked would exceed max: {new_locked_b} > {self._max_b}"
+                    f"Total locked would exceed max: {_from_units(new_locked_b)} > {self.max_b}"
                 )
                 return False
             
-            if amount > self.free:
+            if units > self._free:
                 self._audit.log_policy_violation(
                     "LOCK_STRATEGY_B",
                     f"Insufficient free capital: {amount} > {self.free}"
@@ -129,64 +229,99 @@ class CapitalManager:
             
             old_locked = self._locked_b
             self._locked_b = new_locked_b
+            self._update_free()
             
-            self._audit.log_capital_change("locked_b", old_locked, self._locked_b, "LOCK_STRATEGY_B")
-            self._notify_subscribers()
-            return True
+            self._audit.log_capital_change(
+                "locked_b", _from_units(old_locked), self.locked_b, "LOCK_STRATEGY_B"
+            )
+            pending = self._prepare_notification()
+        
+        self._notify_subscribers(pending)
+        return True
     
     def release_from_strategy_a(self, amount: float) -> None:
         """Release locked capital from Strategy A."""
         with self._lock:
             if amount <= 0:
                 raise CapitalAllocationError("Release amount must be positive")
+            units = _to_units(amount)
             
-            if amount > self._locked_a:
+            if units > self._locked_a:
                 raise CapitalAllocationError(
-                    f"Cannot release {amount}, only {self._locked_a} locked"
+                    f"Cannot release {amount}, only {self.locked_a} locked"
                 )
             
             old_locked = self._locked_a
-            self._locked_a -= amount
+            self._locked_a -= units
+            self._update_free()
             
-            self._audit.log_capital_change("locked_a", old_locked, self._locked_a, "RELEASE_STRATEGY_A")
-            self._notify_subscribers()
+            self._audit.log_capital_change(
+                "locked_a", _from_units(old_locked), self.locked_a, "RELEASE_STRATEGY_A"
+            )
+            pending = self._prepare_notification()
+        
+        self._notify_subscribers(pending)
     
     def release_from_strategy_b(self, amount: float) -> None:
         """Release locked capital from Strategy B."""
         with self._lock:
             if amount <= 0:
                 raise CapitalAllocationError("Release amount must be positive")
+            units = _to_units(amount)
             
-            if amount > self._locked_b:
+            if units > self._locked_b:
                 raise CapitalAllocationError(
-                    f"Cannot release {amount}, only {self._locked_b} locked"
+                    f"Cannot release {amount}, only {self.locked_b} locked"
                 )
             
             old_locked = self._locked_b
-            self._locked_b -= amount
+            self._locked_b -= units
+            self._update_free()
             
-            self._audit.log_capital_change("locked_b", old_locked, self._locked_b, "RELEASE_STRATEGY_B")
-            self._notify_subscribers()
+            self._audit.log_capital_change(
+                "locked_b", _from_units(old_locked), self.locked_b, "RELEASE_STRATEGY_B"
+            )
+            pending = self._prepare_notification()
+        
+        self._notify_subscribers(pending)
     
     def release_all_strategy_a(self) -> float:
         """Release all capital locked for Strategy A. Returns amount released."""
+        # Lock-free fast path: a single attribute read is atomic, and an
+        # empty pool has nothing to release, audit or notify.
+        if not self._locked_a:
+            return 0.0
+        
+        pending = None
         with self._lock:
-            amount = self._locked_a
+            amount = _from_units(self._locked_a)
             if amount > 0:
                 self._locked_a = 0
+                self._update_free()
                 self._audit.log_capital_change("locked_a", amount, 0, "RELEASE_ALL_STRATEGY_A")
-                self._notify_subscribers()
-            return amount
+                pending = self._prepare_notification()
+        
+        self._notify_subscribers(pending)
+        return amount
     
     def release_all_strategy_b(self) -> float:
         """Release all capital locked for Strategy B. Returns amount released."""
+        # Lock-free fast path: a single attribute read is atomic, and an
+        # empty pool has nothing to release, audit or notify.
+        if not self._locked_b:
+            return 0.0
+        
+        pending = None
         with self._lock:
-            amount = self._locked_b
+            amount = _from_units(self._locked_b)
             if amount > 0:
                 self._locked_b = 0
+                self._update_free()
                 self._audit.log_capital_change("locked_b", amount, 0, "RELEASE_ALL_STRATEGY_B")
-                self._notify_subscribers()
-            return amount
+                pending = self._prepare_notification()
+        
+        self._notify_subscribers(pending)
+        return amount
     
     def freeze_all(self) -> None:
         """Freeze all pools (for kill switch). Sets max allocations to 0."""
@@ -194,25 +329,67 @@ class CapitalManager:
             self._max_a = 0
             self._max_b = 0
             self._audit.log_capital_change("max_allocations", -1, 0, "FREEZE_ALL_POOLS")
-            self._notify_subscribers()
+            pending = self._prepare_notification()
+        
+        self._notify_subscribers(pending)
     
     def subscribe(self, callback: Callable[[CapitalState], None]) -> None:
-        """Subscribe to capital state changes."""
-        self._subscribers.append(callback)
-    
-    def _notify_subscribers(self) -> None:
-        """Notify all subscribers of state change."""
-        state = self.state
-        for callback in self._subscribers:
-            try:
-                callback(state)
-            except Exception:
-                pass
+        """
+        Subscribe to capital state changes.
+        Callbacks run on the "CapitalNotify" background thread, never on the
+        caller's thread: GUI (Qt) subscribers must marshal to their own
+        thread, e.g. by emitting a signal. Exceptions are logged to audit.
+        """
+        with self._lock:
+            self._subscribers = (*self._subscribers, callback)
+    
+    def _update_free(self) -> None:
+        """Refresh the cached free capital after a pool change."""
+        self._free = self._total - self._locked_a - self._locked_b
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Coalesce notifications: pool changes made inside the block produce
+        a single subscriber notification when the outermost block exits.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            pending = None
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._batch_dirty:
+                    self._batch_dirty = False
+                    pending = self._prepare_notification()
+            self._notify_subscribers(pending)
+    
+    def _prepare_notification(self) -> tuple[CapitalState, tuple] | None:
+        """
+        Snapshot state and subscribers for a notification. Must be called
+        with the lock held; returns None while a batch is open.
+        """
+        if self._batch_depth > 0:
+            self._batch_dirty = True
+            return None
+        return self.state, self._subscribers
+    
+    def _notify_subscribers(self, pending: tuple[CapitalState, tuple] | None) -> None:
+        """
+        Hand a prepared notification to the background dispatcher. Called
+        after the lock is released; callbacks run on the dispatcher thread.
+        """
+        if pending is None or not pending[1]:
+            return
+        state, subscribers = pending
+        _dispatcher.submit(self, state, subscribers)
     
     @property
     def free(self) -> float:
         """Available (unallocated) capital."""
-        return self._total - self._locked_a - self._locked_b
+        return _from_units(self._free)
     
     def get_available_capital(self) -> float:
         """Helper for strategies to check their available allocation."""
@@ -222,30 +399,30 @@ class CapitalManager:
     def state(self) -> CapitalState:
         """Current state of all pools."""
         return CapitalState(
-            total=self._total,
-            locked_a=self._locked_a,
-            locked_b=self._locked_b,
-            free=self.free
+            total=_from_units(self._total),
+            locked_a=_from_units(self._locked_a),
+            locked_b=_from_units(self._locked_b),
+            free=_from_units(self._free)
         )
     
     @property
     def total(self) -> float:
-        return self._total
+        return _from_units(self._total)
     
     @property
     def locked_a(self) -> float:
-        return self._locked_a
+        return _from_units(self._locked_a)
     
     @property
     def locked_b(self) -> float:
-        return self._locked_b
+        return _from_units(self._locked_b)
 
     @property
     def max_a(self) -> float:
         """Maximum allocation allowed for Strategy A."""
-        return self._max_a
+        return _from_units(self._max_a)
 
     @property
     def max_b(self) -> float:
         """Maximum allocation allowed for Strategy B."""
-        return self._max_b
+        return _from_units(self._max_b)
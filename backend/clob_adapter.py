@@ -16,38 +16,80 @@ Responsibilities:
 import asyncio
 import aiohttp
 import ssl
+import time
 import certifi
 from dataclasses import dataclass
+from enum import IntEnum
+from functools import cached_property
+from itertools import accumulate
+from bisect import bisect_right
 from typing import List, Dict, Optional, Tuple
 from decimal import Decimal
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
+# Built once: loading the CA bundle is expensive and the context is reusable
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
 # Type alias for Order Book Level: [price, size]
 # Using strings for precision if coming from JSON, converted to floats/Decimals for calc
 OrderBookLevel = List[str] 
 
+
+class Side(IntEnum):
+    """Taker side of an order."""
+    BUY = 0
+    SELL = 1
+
+
+# Common spellings resolve with one dict hit; anything else falls back to .upper()
+_SIDE_MAP = {
+    Side.BUY: Side.BUY, Side.SELL: Side.SELL,
+    "BUY": Side.BUY, "SELL": Side.SELL,
+    "buy": Side.BUY, "sell": Side.SELL,
+}
+
+
+def _as_side(side: "Side | str") -> Optional[Side]:
+    """Normalize a side argument; unknown values map to None."""
+    resolved = _SIDE_MAP.get(side)
+    if resolved is None and isinstance(side, str):
+        resolved = _SIDE_MAP.get(side.upper())
+    return resolved
+
+
 @dataclass
 class MarketSnapshot:
-    """Represents a frozen state of the order book."""
+    """
+    Represents a frozen state of the order book.
+    Books are never mutated after construction, so derived prices are
+    computed once per snapshot and cached.
+    """
     token_id: str
     timestamp: int
     bids: List[OrderBookLevel]  # Sorted Descending Price
     asks: List[OrderBookLevel]  # Sorted Ascending Price
     
-    @property
+    @cached_property
     def best_bid(self) -> float:
         return float(self.bids[0][0]) if self.bids else 0.0
         
-    @property
+    @cached_property
     def best_ask(self) -> float:
         return float(self.asks[0][0]) if self.asks else float('inf')
         
-    @property
+    @cached_property
     def spread(self) -> float:
         if not self.bids or not self.asks:
             return 0.0
         return self.best_ask - self.best_bid
         
-    @property
+    @cached_property
     def spread_percent(self) -> float:
         mid = self.midpoint
         if mid == 0:
@@ -59,7 +101,7 @@ class MarketSnapshot:
         """Alias for spread_percent (backward compatibility with UI)."""
         return self.spread_percent
 
-    @property
+    @cached_property
     def midpoint(self) -> float:
         if not self.bids and not self.asks:
             return 0.0
@@ -69,20 +111,103 @@ class MarketSnapshot:
             return self.best_bid
         return (self.best_bid + self.best_ask) / 2.0
 
+    # Struct-of-arrays views: each level string is parsed to float once per
+    # snapshot instead of on every walk of the book.
+    @cached_property
+    def bid_prices(self) -> List[float]:
+        return [float(level[0]) for level in self.bids]
+
+    @cached_property
+    def bid_sizes(self) -> List[float]:
+        return [float(level[1]) for level in self.bids]
+
+    @cached_property
+    def ask_prices(self) -> List[float]:
+        return [float(level[0]) for level in self.asks]
+
+    @cached_property
+    def ask_sizes(self) -> List[float]:
+        return [float(level[1]) for level in self.asks]
+
+    # Cumulative depth: entry i is the total size of levels 0..i
+    @cached_property
+    def bid_cum_sizes(self) -> List[float]:
+        return list(accumulate(self.bid_sizes))
+
+    @cached_property
+    def ask_cum_sizes(self) -> List[float]:
+        return list(accumulate(self.ask_sizes))
+
+    # Size resting on the best TOP_DEPTH levels of each side (feed imbalance)
+    TOP_DEPTH = 5
+
+    @cached_property
+    def bid_volume_top5(self) -> float:
+        return sum(float(level[1]) for level in self.bids[:self.TOP_DEPTH])
+
+    @cached_property
+    def ask_volume_top5(self) -> float:
+        return sum(float(level[1]) for level in self.asks[:self.TOP_DEPTH])
+
+
+def _order_levels(
+    raw_levels: List[dict], descending: bool
+) -> Tuple[List[OrderBookLevel], List[float]]:
+    """
+    Convert raw {"price", "size"} levels to [price, size] pairs in book order,
+    along with their parsed float prices (same order).
+    The API already returns monotonic levels (possibly in the opposite
+    direction), so an O(n) check avoids the O(n log n) keyed sort in the
+    common case.
+    """
+    levels = [[level["price"], level["size"]] for level in raw_levels]
+    prices = [float(level[0]) for level in levels]
+    pairs = list(zip(prices, prices[1:]))
+
+    if descending:
+        if all(a >= b for a, b in pairs):
+            return levels, prices
+        if all(a < b for a, b in pairs):
+            levels.reverse()
+            prices.reverse()
+            return levels, prices
+    else:
+        if all(a <= b for a, b in pairs):
+            return levels, prices
+        if all(a > b for a, b in pairs):
+            levels.reverse()
+            prices.reverse()
+            return levels, prices
+
+    # Unordered input: fall back to a (stable) sort on the parsed prices
+    order = sorted(range(len(levels)), key=prices.__getitem__, reverse=descending)
+    return [levels[i] for i in order], [prices[i] for i in order]
+
 
 class ClobAdapter:
     """
     Deterministic CLOB Analysis Adapter (Async).
     """
     
+    # suggest_limit_price rules keyed by (side, aggressive)
+    _PRICE_RULES = {
+        # Taker buy: pay Best Ask (0.0 = no liquidity to buy)
+        (Side.BUY, True): lambda s: s.best_ask if s.asks else 0.0,
+        # Maker buy: join Best Bid (0.1 = naive floor)
+        (Side.BUY, False): lambda s: s.best_bid if s.bids else 0.1,
+        # Taker sell: hit Best Bid
+        (Side.SELL, True): lambda s: s.best_bid if s.bids else 0.0,
+        # Maker sell: join Best Ask (0.99 = naive ceiling)
+        (Side.SELL, False): lambda s: s.best_ask if s.asks else 0.99,
+    }
+    
     def __init__(self, clob_api_url: str = "https://clob.polymarket.com/"):
         self._base_url = clob_api_url.rstrip('/')
         self._session: aiohttp.ClientSession | None = None
     
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
+            connector = aiohttp.TCPConnector(ssl=_SSL_CONTEXT, limit=100, ttl_dns_cache=300)
             self._session = aiohttp.ClientSession(connector=connector)
         return self._session
 
@@ -90,6 +215,18 @@ class ClobAdapter:
         """Set shared session from orchestrator."""
         self._session = session
 
+    async def close(self):
+        """Close the session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "ClobAdapter":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
     async def get_orderbook(self, token_id: str) -> Optional[MarketSnapshot]:
         """
         Fetch L2 Order Book snapshot (Async).
@@ -101,70 +238,117 @@ class ClobAdapter:
             params = {"token_id": token_id}
 
             async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=3)) as response:
-                data = await response.json()
+                # Check HTTP status first: error pages (502, HTML) are not JSON
+                if response.status != 200:
+                    return None
+
+                data = json_loads(await response.read())
 
                 # Check for API error response
                 if "error" in data:
                     # Silent skip for invalid tokens (expected behavior)
                     return None
 
-                # Check HTTP status after reading body
-                if response.status != 200:
-                    return None
+            # Timestamp (approximate, often not in public book endpoint compared to WS)
+            # We use system time if API doesn't provide hash/timestamp
+            return self._snapshot_from_book(token_id, data, time.time_ns() // 1_000_000)
 
-            # Polymarket API returns dictionary with "bids" and "asks"
-            # Each level is usually {"price": "...", "size": "..."}
-            # We strictly parse and sort to guarantee structure
+        except aiohttp.ClientError as e:
+            # Network/connection errors - log with details
+            print(f"[ClobAdapter] Network error: {type(e).__name__}: {e}")
+            return None
+        except asyncio.TimeoutError:
+            # Timeout - silent skip (expected under load)
+            return None
+        except Exception as e:
+            # Unexpected errors - log with full details
+            print(f"[ClobAdapter] Error fetching book: {type(e).__name__}: {e}")
+            return None
 
-            raw_bids = data.get("bids", [])
-            raw_asks = data.get("asks", [])
+    # Books requested per POST /books call
+    BOOKS_BATCH_SIZE = 100
+
+    async def get_orderbooks(self, token_ids: List[str]) -> Optional[Dict[str, Optional[MarketSnapshot]]]:
+        """
+        Fetch several L2 Order Book snapshots in one round trip per batch (Async).
+        POST /books with [{"token_id": ...}, ...]
+        
+        Returns a dict token_id -> snapshot (None for empty/unknown books),
+        or None if the batch endpoint failed so callers can fall back to
+        per-token get_orderbook().
+        """
+        snapshots: Dict[str, Optional[MarketSnapshot]] = dict.fromkeys(token_ids)
+        if not token_ids:
+            return snapshots
 
-            # Skip empty orderbooks
-            if not raw_bids and not raw_asks:
-                return None
+        try:
+            session = await self._get_session()
+            url = f"{self._base_url}/books"
 
-            # Convert to list of [price, size] and Sort
-            # Bids: High to Low
-            bids = sorted(
-                [[b["price"], b["size"]] for b in raw_bids],
-                key=lambda x: float(x[0]),
-                reverse=True
-            )
+            for start in range(0, len(token_ids), self.BOOKS_BATCH_SIZE):
+                batch = token_ids[start:start + self.BOOKS_BATCH_SIZE]
+                payload = [{"token_id": token_id} for token_id in batch]
 
-            # Asks: Low to High
-            asks = sorted(
-                [[a["price"], a["size"]] for a in raw_asks],
-                key=lambda x: float(x[0]),
-                reverse=False
-            )
+                async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=3)) as response:
+                    if response.status != 200:
+                        return None
+                    data = json_loads(await response.read())
+                    if not isinstance(data, list):
+                        return None
 
-            # Timestamp (approximate, often not in public book endpoint compared to WS)
-            # We use system time if API doesn't provide hash/timestamp
-            import time
-            timestamp = int(time.time() * 1000)
+                timestamp = time.time_ns() // 1_000_000
+                for book in data:
+                    token_id = book.get("asset_id")
+                    if token_id in snapshots:
+                        snapshots[token_id] = self._snapshot_from_book(token_id, book, timestamp)
 
-            return MarketSnapshot(
-                token_id=token_id,
-                timestamp=timestamp,
-                bids=bids,
-                asks=asks
-            )
+            return snapshots
 
         except aiohttp.ClientError as e:
-            # Network/connection errors - log with details
             print(f"[ClobAdapter] Network error: {type(e).__name__}: {e}")
             return None
         except asyncio.TimeoutError:
-            # Timeout - silent skip (expected under load)
             return None
         except Exception as e:
-            # Unexpected errors - log with full details
-            print(f"[ClobAdapter] Error fetching book: {type(e).__name__}: {e}")
+            print(f"[ClobAdapter] Error fetching books: {type(e).__name__}: {e}")
             return None
 
+    @staticmethod
+    def _snapshot_from_book(token_id: str, data: dict, timestamp: int) -> Optional[MarketSnapshot]:
+        """Build a MarketSnapshot from one decoded book payload (None if empty)."""
+        # Polymarket API returns dictionary with "bids" and "asks"
+        # Each level is usually {"price": "...", "size": "..."}
+        # We strictly parse and sort to guarantee structure
+
+        raw_bids = data.get("bids", [])
+        raw_asks = data.get("asks", [])
+
+        # Skip empty orderbooks
+        if not raw_bids and not raw_asks:
+            return None
+
+        # Convert to list of [price, size] and order
+        # Bids: High to Low
+        bids, bid_prices = _order_levels(raw_bids, descending=True)
+
+        # Asks: Low to High
+        asks, ask_prices = _order_levels(raw_asks, descending=False)
+
+        snapshot = MarketSnapshot(
+            token_id=token_id,
+            timestamp=timestamp,
+            bids=bids,
+            asks=asks
+        )
+        # Seed the cached price columns with the floats parsed while
+        # ordering, so no level price string is converted twice
+        snapshot.__dict__['bid_prices'] = bid_prices
+        snapshot.__dict__['ask_prices'] = ask_prices
+        return snapshot
+
     def is_executable(self, 
                      snapshot: MarketSnapshot, 
-                     side: str, 
+                     side: "Side | str", 
                      size: float, 
                      max_spread_pct: float = None) -> bool:
         """
@@ -174,7 +358,7 @@ class ClobAdapter:
         
         Assumes 'side' is the Taker side (BUY means buying from Asks).
         """
-        side = side.upper()
+        side = _as_side(side)
         
         # 1. Spread Check
         if max_spread_pct is not None:
@@ -188,14 +372,14 @@ class ClobAdapter:
         
         depth_available = 0.0
         
-        levels = snapshot.asks if side == "BUY" else snapshot.bids
+        levels = snapshot.asks if side is Side.BUY else snapshot.bids
         
         if not levels:
             return False
             
         return True # For basic feasibility. For full size check use max_executable_size.
 
-    def suggest_limit_price(self, snapshot: MarketSnapshot, side: str, aggressive: bool = True) -> float:
+    def suggest_limit_price(self, snapshot: MarketSnapshot, side: "Side | str", aggressive: bool = True) -> float:
         """
         Suggests a limit price.
         Aggressive (Taker): Cross the spread (Best Ask for Buy).
@@ -203,51 +387,26 @@ class ClobAdapter:
         
         STRICTLY DETERMINISTIC.
         """
-        side = side.upper()
-        
-        if side == "BUY":
-            if aggressive:
-                # To buy immediately, we pay Best Ask
-                if not snapshot.asks:
-                    return 0.0 # No liquidity to buy
-                return snapshot.best_ask
-            else:
-                # To make, we join Best Bid
-                if not snapshot.bids:
-                    return 0.1 # Floor? Naive fallback
-                return snapshot.best_bid
-                
-        elif side == "SELL":
-            if aggressive:
-                # To sell immediately, we hit Best Bid
-                if not snapshot.bids:
-                    return 0.0
-                return snapshot.best_bid
-            else:
-                # To make, we join Best Ask
-                if not snapshot.asks:
-                    return 0.99 # Ceiling?
-                return snapshot.best_ask
-                
-        return 0.0
-
-    def decide_execution_strategy(self, snapshot: MarketSnapshot, side: str, max_taker_spread_pct: float = 1.0) -> Tuple[str, float]:
+        rule = self._PRICE_RULES.get((_as_side(side), bool(aggressive)))
+        return rule(snapshot) if rule else 0.0
+
+    def decide_execution_strategy(self, snapshot: MarketSnapshot, side: "Side | str", max_taker_spread_pct: float = 1.0) -> Tuple[str, float]:
         """
         Decides whether to use Taker (immediate) or Maker (passive) execution.
         Returns (order_type, price).
         """
-        side = side.upper()
+        side = _as_side(side)
         
         if snapshot.spread_percent <= max_taker_spread_pct:
             # Tight spread: Take liquidity
-            price = snapshot.best_ask if side == "BUY" else snapshot.best_bid
+            price = snapshot.best_ask if side is Side.BUY else snapshot.best_bid
             return "FOK", price
         else:
             # Wide spread: Join the book (Maker)
-            price = snapshot.best_bid if side == "BUY" else snapshot.best_ask
+            price = snapshot.best_bid if side is Side.BUY else snapshot.best_ask
             return "GTC", price
 
-    def max_executable_size(self, snapshot: MarketSnapshot, side: str, slippage_pct: float) -> float:
+    def max_executable_size(self, snapshot: MarketSnapshot, side: "Side | str", slippage_pct: float) -> float:
         """
         Calculates the maximum size executable without moving the average price beyond slippage_pct.
         
@@ -258,58 +417,52 @@ class ClobAdapter:
         
         slippage_pct: Max allowed deviation from the Best Price (Top of Book).
                       e.g. 1.0 = 1% slippage allowed.
+        
+        Levels are sorted, so the walk is a binary search for the last level
+        inside the limit plus a lookup in the cached cumulative depth.
         """
-        side = side.upper()
-        levels = snapshot.asks if side == "BUY" else snapshot.bids
+        side = _as_side(side)
+        prices = snapshot.ask_prices if side is Side.BUY else snapshot.bid_prices
         
-        if not levels:
+        if not prices:
             return 0.0
             
-        best_price = float(levels[0][0])
-        limit_price = 0.0
+        best_price = prices[0]
         
-        if side == "BUY":
-            # Max price we are willing to pay
+        if side is Side.BUY:
+            # Max price we are willing to pay (asks ascending)
             limit_price = best_price * (1 + slippage_pct / 100.0)
+            levels_in_limit = bisect_right(prices, limit_price)
+            cum_sizes = snapshot.ask_cum_sizes
         else:
-            # Min price we are willing to accept
+            # Min price we are willing to accept (bids descending)
             limit_price = best_price * (1 - slippage_pct / 100.0)
+            levels_in_limit = bisect_right(prices, -limit_price, key=lambda p: -p)
+            cum_sizes = snapshot.bid_cum_sizes
             
-        executable_size = 0.0
+        if levels_in_limit == 0:
+            return 0.0
+        return cum_sizes[levels_in_limit - 1]
+
+# --- Exemples d'intégration ---
+
+async def _demo(token_id: str) -> None:
+    async with ClobAdapter() as adapter:
+        print(f"Fetching book for {token_id[:10]}...")
+        snapshot = await adapter.get_orderbook(token_id)
         
-        for level in levels:
-            p = float(level[0])
-            s = float(level[1])
+        if snapshot:
+            print(f"Spread: {snapshot.spread_percent:.2f}%")
+            print(f"Best Bid: {snapshot.best_bid}, Best Ask: {snapshot.best_ask}")
             
-            # Check if this level is within limit
-            if side == "BUY":
-                if p > limit_price:
-                    break
-            else:
-                if p < limit_price:
-                    break
+            # Buy Logic
+            max_buy = adapter.max_executable_size(snapshot, "BUY", slippage_pct=1.0)
+            print(f"Max Buy Size (1% slippage): {max_buy}")
             
-            executable_size += s
-            
-        return executable_size
-
-# --- Exemples d'intégration ---
+            suggested_price = adapter.suggest_limit_price(snapshot, "BUY", aggressive=True)
+            print(f"Suggested Taker Buy Price: {suggested_price}")
 
 if __name__ == "__main__":
     # Test minimal
-    adapter = ClobAdapter()
     token_id = "21742633143463906290569050155826241533067272736897614950488156847949938836455" # Example ID (Donald Trump Winner 2024?)
-    
-    print(f"Fetching book for {token_id[:10]}...")
-    snapshot = adapter.get_orderbook(token_id)
-    
-    if snapshot:
-        print(f"Spread: {snapshot.spread_percent:.2f}%")
-        print(f"Best Bid: {snapshot.best_bid}, Best Ask: {snapshot.best_ask}")
-        
-        # Buy Logic
-        max_buy = adapter.max_executable_size(snapshot, "BUY", slippage_pct=1.0)
-        print(f"Max Buy Size (1% slippage): {max_buy}")
-        
-        suggested_price = adapter.suggest_limit_price(snapshot, "BUY", aggressive=True)
-        print(f"Suggested Taker Buy Price: {suggested_price}")
+    asyncio.run(_demo(token_id))
@@ -4,21 +4,29 @@ Loads and validates configuration from JSON file.
 No default values - all parameters must be explicit.
 """
 
-import json
 from pathlib import Path
-from typing import Any
-from dataclasses import dataclass
-from urllib.parse import urlparse
+from typing import Any, ClassVar
+from dataclasses import dataclass, fields, replace
+import re
 
+try:
+    import orjson
+    json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+    json_loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CapitalConfig:
     total: float
     max_allocation_strategy_a: float
     max_allocation_strategy_b: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StrategyAConfig:
     enabled: bool
     name: str
@@ -33,7 +41,7 @@ class StrategyAConfig:
     orderbook_cache_ttl_ms: int = 150  # Orderbook cache TTL in ms
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StrategyBConfig:
     enabled: bool
     name: str
@@ -46,14 +54,14 @@ class StrategyBConfig:
     exit_config: dict | None = None  # v3.2: Exit strategy configuration
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskConfig:
     max_drawdown_percent: float
     max_daily_loss: float
     kill_switch_threshold: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketConfig:
     connection_timeout_seconds: int
     heartbeat_interval_seconds: int
@@ -63,7 +71,7 @@ class MarketConfig:
     paper_trading: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BotConfig:
     capital: CapitalConfig
     strategy_a: StrategyAConfig
@@ -73,22 +81,77 @@ class BotConfig:
     file_path: str
 
 
+# Constructor plan per section dataclass: (field name, default) in declaration
+# order, so sections are built positionally instead of via ** kwargs.
+_FIELD_PLANS = {
+    cls: tuple((f.name, f.default) for f in fields(cls))
+    for cls in (CapitalConfig, StrategyAConfig, StrategyBConfig, RiskConfig)
+}
+_FIELD_NAMES = {cls: frozenset(name for name, _ in plan) for cls, plan in _FIELD_PLANS.items()}
+
+# scheme://netloc prefix of an endpoint URL (scheme case-insensitive, like urlparse)
+_URL_RE = re.compile(r'([a-z][a-z0-9+.\-]*)://([^/?#]*)', re.IGNORECASE | re.ASCII)
+_ALLOWED_SCHEMES = frozenset({'http', 'https', 'ws', 'wss'})
+
+
 class ConfigValidationError(Exception):
     """Raised when configuration validation fails."""
     pass
 
 
+def _raise_missing(section: str, values: dict[str, Any], required: frozenset) -> None:
+    """Slow path of the generated checker: report every missing key."""
+    keys = ", ".join(f"{section}.{key}" for key in sorted(required.difference(values)))
+    raise ConfigValidationError(f"Missing key: {keys}")
+
+
+def _compile_required_check(required_keys: dict[str, frozenset]):
+    """
+    Generate a straight-line checker for the fixed schema.
+    The returned function takes the raw config dict, verifies every section
+    and required key with inline membership tests (no loops over the schema)
+    and returns the sections in REQUIRED_KEYS order.
+    """
+    lines = ["def _required_sections(data):"]
+    names = []
+    for index, (section, required) in enumerate(required_keys.items()):
+        name = f"s{index}"
+        names.append(name)
+        present = " and ".join(f"{key!r} in {name}" for key in sorted(required))
+        lines += [
+            f"    if {section!r} not in data:",
+            f"        raise ConfigValidationError('Missing section: ' + {section!r})",
+            f"    {name} = data[{section!r}]",
+            f"    if not ({present}):",
+            f"        _raise_missing({section!r}, {name}, required_keys[{section!r}])",
+        ]
+    lines.append(f"    return {', '.join(names)}")
+    
+    namespace = {
+        'ConfigValidationError': ConfigValidationError,
+        '_raise_missing': _raise_missing,
+        'required_keys': required_keys,
+    }
+    exec(compile("\n".join(lines), "<config-schema>", "exec"), namespace)
+    return namespace['_required_sections']
+
+
 class ConfigLoader:
     """Loads and validates bot configuration from JSON file."""
     
+    # Schema source for the generated _required_sections checker
     REQUIRED_KEYS = {
-        'capital': ['total', 'max_allocation_strategy_a', 'max_allocation_strategy_b'],
-        'strategy_a': ['enabled', 'name', 'trade_size_percent'],
-        'strategy_b': ['enabled', 'name', 'spread_min', 'spread_max', 'max_exposure', 'trade_size_percent'],
-        'risk': ['max_drawdown_percent', 'max_daily_loss', 'kill_switch_threshold'],
-        'market': ['connection_timeout_seconds', 'heartbeat_interval_seconds', 'paper_trading']
+        'capital': frozenset({'total', 'max_allocation_strategy_a', 'max_allocation_strategy_b'}),
+        'strategy_a': frozenset({'enabled', 'name', 'trade_size_percent'}),
+        'strategy_b': frozenset({'enabled', 'name', 'spread_min', 'spread_max', 'max_exposure', 'trade_size_percent'}),
+        'risk': frozenset({'max_drawdown_percent', 'max_daily_loss', 'kill_switch_threshold'}),
+        'market': frozenset({'connection_timeout_seconds', 'heartbeat_interval_seconds', 'paper_trading'})
     }
     
+    # Validated configs keyed by (resolved path, mtime_ns, size), oldest first
+    _cache: ClassVar[dict[tuple[str, int, int], BotConfig]] = {}
+    CACHE_MAX_ENTRIES = 8
+    
     def __init__(self):
         self._config: BotConfig | None = None
     
@@ -105,89 +168,111 @@ class ConfigLoader:
         if not path.suffix == '.json':
             raise ConfigValidationError("Config file must be JSON format")
         
+        # Unchanged file: skip read/parse/validate and share the cached
+        # (frozen) BotConfig. Strategies copy the config dicts they edit.
+        # Size guards against same-mtime rewrites on coarse-grained filesystems.
+        stat = path.stat()
+        cache_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._config = replace(cached, file_path=str(path))
+            return self._config
+        
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            # Parse straight from bytes: no text-mode decode step
+            data = json_loads(path.read_bytes())
+        except JSONDecodeError as e:
             raise ConfigValidationError(f"Invalid JSON: {e}")
         
-        self._validate_structure(data)
-        self._validate_values(data)
-        
         self._config = self._build_config(data, str(path))
+        if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+            # FIFO eviction: dicts keep insertion order
+            del self._cache[next(iter(self._cache))]
+        self._cache[cache_key] = self._config
         return self._config
     
-    def _validate_structure(self, data: dict[str, Any]) -> None:
-        """Validate all required keys are present."""
-        for section, keys in self.REQUIRED_KEYS.items():
-            if section not in data:
-                raise ConfigValidationError(f"Missing section: {section}")
-            
-            for key in keys:
-                if key not in data[section]:
-                    raise ConfigValidationError(f"Missing key: {section}.{key}")
+    @staticmethod
+    def _construct(cls: type, section: str, values: dict[str, Any]) -> Any:
+        """Build a section dataclass positionally from its precomputed field plan."""
+        unknown = values.keys() - _FIELD_NAMES[cls]
+        if unknown:
+            keys = ", ".join(f"{section}.{key}" for key in sorted(unknown))
+            raise ConfigValidationError(f"Unknown key: {keys}")
+        # Required fields are guaranteed present by _required_sections
+        return cls(*[values.get(name, default) for name, default in _FIELD_PLANS[cls]])
     
-    def _validate_values(self, data: dict[str, Any]) -> None:
-        """Validate configuration values are within acceptable ranges."""
-        capital = data['capital']
+    def _validate_endpoint(self, url: str, section: str, key: str) -> str:
+        """Validate that a URL/Endpoint is well-formed and safe."""
+        if not url:
+            return url
+            
+        if not isinstance(url, str):
+            raise ConfigValidationError(f"Malformed URL in {section}.{key}: {url!r}")
         
-        if capital['total'] <= 0:
+        match = _URL_RE.match(url)
+        if match:
+            scheme = match[1].lower()
+        else:
+            scheme, colon, _ = url.partition(':')
+            scheme = scheme.lower() if colon else ''
+        # Basic scheme validation
+        if scheme not in _ALLOWED_SCHEMES:
+            raise ConfigValidationError(f"Invalid scheme in {section}.{key}: {scheme}")
+        
+        # Basic hostname validation (must have a domain)
+        if not match or not match[2]:
+            raise ConfigValidationError(f"Invalid hostname in {section}.{key}")
+            
+        return url
+
+    def _build_config(self, data: dict[str, Any], file_path: str) -> BotConfig:
+        """
+        Validate and build the typed configuration in a single pass.
+        Required keys are checked by the generated _required_sections, then
+        each section is range-validated and converted in turn.
+        """
+        capital, strat_a_data, strat_b_data, risk, market_data = self._required_sections(data)
+        
+        total = capital['total']
+        max_a = capital['max_allocation_strategy_a']
+        max_b = capital['max_allocation_strategy_b']
+        
+        if total <= 0:
             raise ConfigValidationError("capital.total must be positive")
         
-        if capital['max_allocation_strategy_a'] < 0:
+        if max_a < 0:
             raise ConfigValidationError("capital.max_allocation_strategy_a cannot be negative")
         
-        if capital['max_allocation_strategy_b'] < 0:
+        if max_b < 0:
             raise ConfigValidationError("capital.max_allocation_strategy_b cannot be negative")
         
-        total_allocation = capital['max_allocation_strategy_a'] + capital['max_allocation_strategy_b']
-        if total_allocation > capital['total']:
+        if max_a + max_b > total:
             raise ConfigValidationError(
                 "Sum of strategy allocations exceeds total capital"
             )
+        capital_config = self._construct(CapitalConfig, 'capital', capital)
         
-        strategy_a = data['strategy_a']
-        if not (0 < strategy_a.get('trade_size_percent', 0) <= 100):
+        if not (0 < strat_a_data['trade_size_percent'] <= 100):
             raise ConfigValidationError("strategy_a.trade_size_percent must be between 0 and 100")
+        # Handle optional config fields that might be missing in older configs.
+        # Filled in place: `data` is freshly parsed by load() and never retained.
+        strat_a_data.setdefault('min_volume', 1000.0)
+        strategy_a_config = self._construct(StrategyAConfig, 'strategy_a', strat_a_data)
         
-        strategy_b = data['strategy_b']
-        if strategy_b['spread_min'] >= strategy_b['spread_max']:
+        if strat_b_data['spread_min'] >= strat_b_data['spread_max']:
             raise ConfigValidationError("strategy_b.spread_min must be less than spread_max")
             
-        if not (0 < strategy_b['trade_size_percent'] <= 100):
+        if not (0 < strat_b_data['trade_size_percent'] <= 100):
             raise ConfigValidationError("strategy_b.trade_size_percent must be between 0 and 100")
+        strategy_b_config = self._construct(StrategyBConfig, 'strategy_b', strat_b_data)
         
-        risk = data['risk']
-        if risk['max_drawdown_percent'] <= 0 or risk['max_drawdown_percent'] > 100:
+        max_drawdown = risk['max_drawdown_percent']
+        if max_drawdown <= 0 or max_drawdown > 100:
             raise ConfigValidationError("risk.max_drawdown_percent must be between 0 and 100")
         
         if risk['kill_switch_threshold'] <= 0:
             raise ConfigValidationError("risk.kill_switch_threshold must be positive")
-    
-    def _validate_endpoint(self, url: str, section: str, key: str) -> str:
-        """Validate that a URL/Endpoint is well-formed and safe."""
-        if not url:
-            return url
-            
-        try:
-            parsed = urlparse(url)
-            # Basic scheme validation
-            if parsed.scheme not in ('http', 'https', 'ws', 'wss'):
-                raise ConfigValidationError(f"Invalid scheme in {section}.{key}: {parsed.scheme}")
-            
-            # Basic hostname validation (must have a domain)
-            if not parsed.netloc:
-                raise ConfigValidationError(f"Invalid hostname in {section}.{key}")
-                
-            return url
-        except Exception as e:
-            if isinstance(e, ConfigValidationError):
-                raise
-            raise ConfigValidationError(f"Malformed URL in {section}.{key}: {str(e)}")
-
-    def _build_config(self, data: dict[str, Any], file_path: str) -> BotConfig:
-        """Build typed configuration object from validated data."""
-        market_data = data['market']
+        risk_config = self._construct(RiskConfig, 'risk', risk)
         
         # Security: Validate endpoints
         rpc_url = self._validate_endpoint(market_data.get('rpc_url', ""), 'market', 'rpc_url')
@@ -195,24 +280,19 @@ class ConfigLoader:
         gamma_api_url = self._validate_endpoint(market_data.get('gamma_api_url', ""), 'market', 'gamma_api_url')
 
         market_config = MarketConfig(
-            connection_timeout_seconds=market_data.get('connection_timeout_seconds', 30),
-            heartbeat_interval_seconds=market_data.get('heartbeat_interval_seconds', 5),
+            connection_timeout_seconds=market_data['connection_timeout_seconds'],
+            heartbeat_interval_seconds=market_data['heartbeat_interval_seconds'],
             rpc_url=rpc_url or "https://polygon-rpc.com",
             clob_api_url=clob_api_url or "https://clob.polymarket.com/",
             gamma_api_url=gamma_api_url or "https://gamma-api.polymarket.com/",
-            paper_trading=market_data.get('paper_trading', False)
+            paper_trading=market_data['paper_trading']
         )
-        
-        # Handle optional config fields that might be missing in older configs
-        strat_a_data = data['strategy_a'].copy()
-        if 'min_volume' not in strat_a_data:
-            strat_a_data['min_volume'] = 1000.0
 
         return BotConfig(
-            capital=CapitalConfig(**data['capital']),
-            strategy_a=StrategyAConfig(**strat_a_data),
-            strategy_b=StrategyBConfig(**data['strategy_b']),
-            risk=RiskConfig(**data['risk']),
+            capital=capital_config,
+            strategy_a=strategy_a_config,
+            strategy_b=strategy_b_config,
+            risk=risk_config,
             market=market_config,
             file_path=file_path
         )
@@ -228,3 +308,6 @@ class ConfigLoader:
     def is_loaded(self) -> bool:
         """Whether a valid configuration is loaded."""
         return self._config is not None
+
+
+ConfigLoader._required_sections = staticmethod(_compile_required_check(ConfigLoader.REQUIRED_KEYS))
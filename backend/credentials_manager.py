@@ -5,8 +5,11 @@ Credentials exist in memory only during bot execution.
 """
 
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import Callable
 from pathlib import Path
+import ctypes
+import ctypes.util
 import threading
 
 from .secure_vault import (
@@ -26,6 +29,45 @@ CRED_POLYMARKET_API_SECRET = "polymarket_api_secret"
 CRED_POLYMARKET_API_PASSPHRASE = "polymarket_api_passphrase"
 
 
+class CredSlot(IntEnum):
+    """Position of each credential in the in-memory credentials tuple."""
+    WALLET = 0
+    API_KEY = 1
+    API_SECRET = 2
+    API_PASSPHRASE = 3
+
+
+# Vault (on-disk) key for each slot, in CredSlot order
+_SLOT_KEYS = (
+    CRED_WALLET_PRIVATE_KEY,
+    CRED_POLYMARKET_API_KEY,
+    CRED_POLYMARKET_API_SECRET,
+    CRED_POLYMARKET_API_PASSPHRASE,
+)
+
+Credentials = tuple[bytearray | None, ...]
+
+
+try:
+    # explicit_bzero (glibc >= 2.25, BSDs) is guaranteed not to be elided
+    _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6")
+    _zero_memory = _libc.explicit_bzero
+    _zero_memory.restype = None
+    _zero_memory.argtypes = (ctypes.c_void_p, ctypes.c_size_t)
+except (OSError, AttributeError):
+    # Windows/macOS: a foreign memset call is not visible to any optimizer either
+    _zero_memory = lambda address, size: ctypes.memset(address, 0, size)
+
+
+def _wipe(buffer: bytearray) -> None:
+    """Zero a credential buffer in place."""
+    size = len(buffer)
+    if size:
+        view = (ctypes.c_char * size).from_buffer(buffer)
+        _zero_memory(ctypes.addressof(view), size)
+        del view
+
+
 @dataclass
 class CredentialsStatus:
     """Status of credentials manager."""
@@ -60,9 +102,18 @@ class CredentialsManager:
             self._vault_path = str(home / self.DEFAULT_VAULT_PATH)
         
         self._vault = SecureVault(self._vault_path)
+        # Last known vault existence. Writers' status snapshots use it as is;
+        # get_status(), vault_exists and unlock re-stat the file (cheap) so
+        # a vault removed or restored outside the app is picked up.
+        self._vault_exists_cached = self._vault.exists()
         
-        # In-memory credentials (NEVER logged or persisted)
-        self._credentials: dict[str, str] | None = None
+        # In-memory credentials (NEVER logged or persisted). Held as mutable
+        # buffers so lock/destroy can really overwrite the secret bytes.
+        # Writers (under _lock) rebind this attribute and zero retracted
+        # buffers in place, so secret readers decode under the same lock;
+        # status checks only need a lock-free snapshot of the reference.
+        # Indexed by CredSlot: hot-path reads are a tuple index, not a dict lookup.
+        self._credentials: Credentials | None = None
         self._lock = threading.Lock()
         
         # Callbacks
@@ -70,7 +121,7 @@ class CredentialsManager:
         
         self._audit.log(EventType.OPERATOR_ACTION, "CREDENTIALS_MANAGER_INITIALIZED", {
             "vault_path": self._vault_path,
-            "vault_exists": self._vault.exists()
+            "vault_exists": self._vault_exists_cached
         })
     
     def create_vault(
@@ -103,20 +154,22 @@ class CredentialsManager:
                 }
                 
                 self._vault.create(credentials, master_password)
-                
-                # Log event (NO credential values!)
-                self._audit.log(EventType.OPERATOR_ACTION, "VAULT_CREATED", {
-                    "vault_path": self._vault_path
-                })
-                
-                self._notify_status()
-                return True, "Vault créé avec succès"
+                self._vault_exists_cached = True
+                status = self._build_status()
                 
             except Exception as e:
                 self._audit.log(EventType.SYSTEM_ERROR, "VAULT_CREATE_FAILED", {
                     "error_type": type(e).__name__
                 })
                 return False, f"Échec création vault: {type(e).__name__}"
+        
+        # Log event (NO credential values!)
+        self._audit.log(EventType.OPERATOR_ACTION, "VAULT_CREATED", {
+            "vault_path": self._vault_path
+        })
+        
+        self._notify_status(status)
+        return True, "Vault créé avec succès"
     
     def unlock_vault(self, master_password: str) -> tuple[bool, str]:
         """
@@ -128,38 +181,55 @@ class CredentialsManager:
         Returns:
             (success, message)
         """
+        # Key derivation and decryption only read the vault file, so they run
+        # outside the lock; the lock is held just to publish the result.
+        if not self.refresh_vault_exists():
+            return False, "Vault inexistant"
+        try:
+            decrypted = self._vault.decrypt(master_password)
+            credentials = tuple(
+                bytearray(value.encode('utf-8')) if (value := decrypted.get(key)) is not None else None
+                for key in _SLOT_KEYS
+            )
+        except VaultNotFoundError:
+            self.refresh_vault_exists()
+            return False, "Vault inexistant"
+        except VaultDecryptionError:
+            self._audit.log(EventType.SYSTEM_ERROR, "VAULT_UNLOCK_FAILED", {
+                "reason": "DECRYPTION_FAILED"
+            })
+            return False, "Mot de passe incorrect"
+        except VaultCorruptedError:
+            self._audit.log(EventType.KILL_SWITCH, "VAULT_CORRUPTED", {})
+            return False, "VAULT_CORRUPTED"
+        except Exception as e:
+            self._audit.log(EventType.SYSTEM_ERROR, "VAULT_UNLOCK_ERROR", {
+                "error_type": type(e).__name__
+            })
+            return False, f"Erreur: {type(e).__name__}"
+        
+        # Validate required credentials present
+        if not self._validate_credentials(credentials):
+            self._wipe_all(credentials)
+            return False, "Credentials incomplets dans le vault"
+        
         with self._lock:
-            try:
-                self._credentials = self._vault.decrypt(master_password)
-                
-                # Validate required credentials present
-                if not self._validate_credentials():
-                    self._credentials = None
-                    return False, "Credentials incomplets dans le vault"
-                
-                self._audit.log(EventType.OPERATOR_ACTION, "VAULT_UNLOCKED", {
-                    "has_wallet": bool(self._credentials.get(CRED_WALLET_PRIVATE_KEY)),
-                    "has_polymarket": bool(self._credentials.get(CRED_POLYMARKET_API_KEY))
-                })
-                
-                self._notify_status()
-                return True, "Vault déverrouillé"
-                
-            except VaultNotFoundError:
-                return False, "Vault inexistant"
-            except VaultDecryptionError:
-                self._audit.log(EventType.SYSTEM_ERROR, "VAULT_UNLOCK_FAILED", {
-                    "reason": "DECRYPTION_FAILED"
-                })
-                return False, "Mot de passe incorrect"
-            except VaultCorruptedError:
-                self._audit.log(EventType.KILL_SWITCH, "VAULT_CORRUPTED", {})
-                return False, "VAULT_CORRUPTED"
-            except Exception as e:
-                self._audit.log(EventType.SYSTEM_ERROR, "VAULT_UNLOCK_ERROR", {
-                    "error_type": type(e).__name__
-                })
-                return False, f"Erreur: {type(e).__name__}"
+            # Publish with a single rebind
+            previous, self._credentials = self._credentials, credentials
+            status = self._build_status()
+        
+        # No longer reachable by readers: wipe the previous set, audit and
+        # notify without holding the lock
+        if previous:
+            self._wipe_all(previous)
+        
+        self._audit.log(EventType.OPERATOR_ACTION, "VAULT_UNLOCKED", {
+            "has_wallet": status.has_wallet,
+            "has_polymarket": status.has_polymarket
+        })
+        
+        self._notify_status(status)
+        return True, "Vault déverrouillé"
     
     def lock_vault(self) -> None:
         """
@@ -167,15 +237,15 @@ class CredentialsManager:
         Called on bot shutdown or kill switch.
         """
         with self._lock:
-            if self._credentials:
-                # Clear credential values
-                for key in self._credentials:
-                    self._credentials[key] = ""
-                self._credentials = None
-                
-                self._audit.log(EventType.OPERATOR_ACTION, "VAULT_LOCKED", {})
-            
-            self._notify_status()
+            retracted = self._credentials is not None
+            if retracted:
+                self._retract_credentials()
+            status = self._build_status()
+        
+        if retracted:
+            self._audit.log(EventType.OPERATOR_ACTION, "VAULT_LOCKED", {})
+        
+        self._notify_status(status)
     
     def destroy_credentials(self) -> None:
         """
@@ -183,15 +253,15 @@ class CredentialsManager:
         Called by kill switch.
         """
         with self._lock:
-            if self._credentials:
-                for key in list(self._credentials.keys()):
-                    self._credentials[key] = "\x00" * len(self._credentials[key])
-                self._credentials.clear()
-                self._credentials = None
-                
-                self._audit.log(EventType.KILL_SWITCH, "CREDENTIALS_DESTROYED", {})
-            
-            self._notify_status()
+            retracted = self._credentials is not None
+            if retracted:
+                self._retract_credentials()
+            status = self._build_status()
+        
+        if retracted:
+            self._audit.log(EventType.KILL_SWITCH, "CREDENTIALS_DESTROYED", {})
+        
+        self._notify_status(status)
     
     def get_wallet_private_key(self) -> str | None:
         """
@@ -200,10 +270,12 @@ class CredentialsManager:
         
         WARNING: Value must never be logged or transmitted.
         """
+        # Under the lock: lock/destroy zero these buffers in place
         with self._lock:
-            if not self._credentials:
+            credentials = self._credentials
+            if not credentials:
                 return None
-            return self._credentials.get(CRED_WALLET_PRIVATE_KEY)
+            return self._reveal(credentials[CredSlot.WALLET])
     
     def get_polymarket_credentials(self) -> dict[str, str] | None:
         """
@@ -212,56 +284,75 @@ class CredentialsManager:
         
         WARNING: Values must never be logged or transmitted.
         """
+        # Under the lock: lock/destroy zero these buffers in place
         with self._lock:
-            if not self._credentials:
+            credentials = self._credentials
+            if not credentials:
                 return None
             
             creds = {
-                'api_key': self._credentials.get(CRED_POLYMARKET_API_KEY),
-                'api_secret': self._credentials.get(CRED_POLYMARKET_API_SECRET),
-                'api_passphrase': self._credentials.get(CRED_POLYMARKET_API_PASSPHRASE),
-                'api_private_key': self._credentials.get(CRED_WALLET_PRIVATE_KEY)
+                'api_key': self._reveal(credentials[CredSlot.API_KEY]),
+                'api_secret': self._reveal(credentials[CredSlot.API_SECRET]),
+                'api_passphrase': self._reveal(credentials[CredSlot.API_PASSPHRASE]),
+                'api_private_key': self._reveal(credentials[CredSlot.WALLET])
             }
-            
-            if all(creds.values()):
-                return creds
-            return None
-    
-    def _validate_credentials(self) -> bool:
-        """Validate that all required credentials are present."""
-        if not self._credentials:
-            return False
-        
-        required = [
-            CRED_WALLET_PRIVATE_KEY,
-            CRED_POLYMARKET_API_KEY,
-            CRED_POLYMARKET_API_SECRET,
-            CRED_POLYMARKET_API_PASSPHRASE
-        ]
         
-        for key in required:
-            if not self._credentials.get(key):
-                return False
-        
-        return True
+        if all(creds.values()):
+            return creds
+        return None
+    
+    @staticmethod
+    def _reveal(value: bytearray | None) -> str | None:
+        """Decode one credential for a consumer (caller holds the lock)."""
+        return value.decode('utf-8') if value is not None else None
+    
+    @staticmethod
+    def _wipe_all(credentials: Credentials) -> None:
+        """Zero every buffer of an unpublished credentials tuple."""
+        for value in credentials:
+            if value is not None:
+                _wipe(value)
+    
+    def _retract_credentials(self) -> None:
+        """Unpublish the credentials, then zero them (caller holds the lock)."""
+        credentials, self._credentials = self._credentials, None
+        self._wipe_all(credentials)
+    
+    @staticmethod
+    def _validate_credentials(credentials: Credentials | None) -> bool:
+        """Validate that all required credentials are present (and non-empty)."""
+        return bool(credentials) and all(credentials)
     
     def get_status(self) -> CredentialsStatus:
         """Get current credentials status (no secrets)."""
+        self.refresh_vault_exists()
+        return self._build_status()
+    
+    def _build_status(self) -> CredentialsStatus:
+        """Snapshot the status from a single read of the credentials reference."""
+        credentials = self._credentials
+        return CredentialsStatus(
+            vault_exists=self._vault_exists_cached,
+            vault_loaded=credentials is not None,
+            has_wallet=bool(credentials and credentials[CredSlot.WALLET]),
+            has_polymarket=bool(credentials and credentials[CredSlot.API_KEY])
+        )
+    
+    def refresh_vault_exists(self) -> bool:
+        """Re-check the vault file on disk (e.g. after external changes)."""
         with self._lock:
-            return CredentialsStatus(
-                vault_exists=self._vault.exists(),
-                vault_loaded=self._credentials is not None,
-                has_wallet=bool(self._credentials and self._credentials.get(CRED_WALLET_PRIVATE_KEY)),
-                has_polymarket=bool(self._credentials and self._credentials.get(CRED_POLYMARKET_API_KEY))
-            )
+            self._vault_exists_cached = self._vault.exists()
+            return self._vault_exists_cached
     
     def subscribe_status(self, callback: Callable[[CredentialsStatus], None]) -> None:
         """Subscribe to credentials status changes."""
         self._status_callbacks.append(callback)
     
-    def _notify_status(self) -> None:
-        """Notify subscribers of status change."""
-        status = self.get_status()
+    def _notify_status(self, status: CredentialsStatus) -> None:
+        """
+        Deliver a status snapshot to subscribers.
+        Called after the lock is released so subscriber code never runs under it.
+        """
         for callback in self._status_callbacks:
             try:
                 callback(status)
@@ -271,13 +362,12 @@ class CredentialsManager:
     @property
     def vault_exists(self) -> bool:
         """Whether vault file exists."""
-        return self._vault.exists()
+        return self.refresh_vault_exists()
     
     @property
     def is_unlocked(self) -> bool:
         """Whether vault is currently unlocked."""
-        with self._lock:
-            return self._credentials is not None
+        return self._credentials is not None
     
     @property
     def vault_path(self) -> str:
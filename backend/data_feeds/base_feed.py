@@ -5,34 +5,45 @@ Abstract interface for all data feeds used by Strategy A.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from enum import Enum
-from typing import Callable, List, Any
+from enum import IntEnum, auto
+from typing import Callable, List, Any, Optional, Tuple
 import asyncio
 import time
 
 
-class TriggerType(Enum):
+class TriggerType(IntEnum):
     """Types of triggers that can be emitted by feeds."""
     # Price-based triggers
-    PRICE_SPIKE_UP = "price_spike_up"      # Rapid price increase
-    PRICE_SPIKE_DOWN = "price_spike_down"  # Rapid price decrease
-    PRICE_BREAKOUT = "price_breakout"      # Price breaks key level
+    PRICE_SPIKE_UP = auto()       # Rapid price increase
+    PRICE_SPIKE_DOWN = auto()     # Rapid price decrease
+    PRICE_BREAKOUT = auto()       # Price breaks key level
 
     # Volume-based triggers
-    VOLUME_SPIKE = "volume_spike"          # Abnormal volume increase
-    LARGE_ORDER = "large_order"            # Large order detected
+    VOLUME_SPIKE = auto()         # Abnormal volume increase
+    LARGE_ORDER = auto()          # Large order detected
 
     # External data triggers
-    SCORE_UPDATE = "score_update"          # Sports score change
-    NEWS_EVENT = "news_event"              # Breaking news
-    SOCIAL_SPIKE = "social_spike"          # Social media activity spike
+    SCORE_UPDATE = auto()         # Sports score change
+    NEWS_EVENT = auto()           # Breaking news
+    SOCIAL_SPIKE = auto()         # Social media activity spike
 
     # Market structure triggers
-    SPREAD_COMPRESSION = "spread_compression"  # Spread narrowing rapidly
-    IMBALANCE_SHIFT = "imbalance_shift"        # Orderbook imbalance change
+    SPREAD_COMPRESSION = auto()   # Spread narrowing rapidly
+    IMBALANCE_SHIFT = auto()      # Orderbook imbalance change
 
+    @property
+    def label(self) -> str:
+        """Lowercase name used in logs and scoreboard triggers (e.g. 'price_spike_up')."""
+        return _TRIGGER_LABELS[self]
+
+
+_TRIGGER_LABELS = {member: member.name.lower() for member in TriggerType}
 
-@dataclass
+# Layout of a trigger's details: (key, ndigits) pairs, ndigits None = unrounded
+DetailSpec = Tuple[Tuple[str, Optional[int]], ...]
+
+
+@dataclass(slots=True, frozen=True)
 class FeedTrigger:
     """
     Standardized trigger format from any feed source.
@@ -51,8 +62,17 @@ class FeedTrigger:
     source: str             # Feed name that generated this
     timestamp: float
 
-    # Additional context
-    details: dict
+    # Additional context, kept raw until a consumer asks for ``details``
+    detail_spec: DetailSpec
+    detail_values: tuple
+
+    @property
+    def details(self) -> dict:
+        """Context dict, rounded for display; built on access."""
+        return {
+            key: value if ndigits is None else round(value, ndigits)
+            for (key, ndigits), value in zip(self.detail_spec, self.detail_values)
+        }
 
 
 class BaseFeed(ABC):
@@ -64,10 +84,13 @@ class BaseFeed(ABC):
     def __init__(self, feed_name: str):
         self._name = feed_name
         self._running = False
-        self._subscribers: List[Callable[[FeedTrigger], Any]] = []
+        # Partitioned once at subscribe time so emits skip the coroutine check
+        self._sync_subscribers: List[Callable[[FeedTrigger], Any]] = []
+        self._async_subscribers: List[Callable[[FeedTrigger], Any]] = []
+        self._fanout_tasks: set[asyncio.Task] = set()
         self._task: asyncio.Task | None = None
         self._trigger_count = 0
-        self._last_trigger_time = 0.0
+        self._last_trigger_time_ns = 0  # time.monotonic_ns() of the last emit
 
     @property
     def name(self) -> str:
@@ -89,12 +112,16 @@ class BaseFeed(ABC):
         Subscribe to trigger events from this feed.
         Callback should be async-compatible.
         """
-        self._subscribers.append(callback)
+        if asyncio.iscoroutinefunction(callback):
+            self._async_subscribers.append(callback)
+        else:
+            self._sync_subscribers.append(callback)
 
     def unsubscribe(self, callback: Callable[[FeedTrigger], Any]) -> None:
         """Remove a subscriber."""
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
+        for subscribers in (self._sync_subscribers, self._async_subscribers):
+            if callback in subscribers:
+                subscribers.remove(callback)
 
     async def start(self) -> None:
         """Start the feed monitoring loop."""
@@ -136,17 +163,31 @@ class BaseFeed(ABC):
         Emit a trigger to all subscribers.
         """
         self._trigger_count += 1
-        self._last_trigger_time = time.time()
+        self._last_trigger_time_ns = time.monotonic_ns()
 
-        for callback in self._subscribers:
+        for callback in self._sync_subscribers:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    asyncio.create_task(callback(trigger))
-                else:
-                    callback(trigger)
+                callback(trigger)
             except Exception:
                 pass  # Don't let subscriber errors crash the feed
 
+        if self._async_subscribers:
+            # One task per emit for the whole async batch, not one per subscriber
+            task = asyncio.create_task(self._fanout(trigger, tuple(self._async_subscribers)))
+            self._fanout_tasks.add(task)
+            task.add_done_callback(self._fanout_tasks.discard)
+
+    @staticmethod
+    async def _fanout(trigger: FeedTrigger, callbacks: tuple) -> None:
+        """Run async subscribers concurrently; their errors are swallowed."""
+        coroutines = []
+        for callback in callbacks:
+            try:
+                coroutines.append(callback(trigger))
+            except Exception:
+                pass
+        await asyncio.gather(*coroutines, return_exceptions=True)
+
     def _generate_trigger_id(self) -> str:
         """Generate a unique trigger ID."""
-        return f"{self._name}_{int(time.time() * 1000)}_{self._trigger_count}"
+        return f"{self._name}_{time.monotonic_ns()}_{self._trigger_count}"
@@ -11,15 +11,30 @@ It monitors:
 """
 
 import asyncio
+import math
 import time
+from array import array
 from dataclasses import dataclass
-from typing import List, Dict, Optional
-from collections import deque
+from typing import List, Dict, Optional, Set
 
-from .base_feed import BaseFeed, FeedTrigger, TriggerType
+from .base_feed import BaseFeed, DetailSpec, FeedTrigger, TriggerType
 
 
-@dataclass
+# Detail layouts shared by every trigger of a detector (key, display rounding)
+_SPIKE_DETAILS: DetailSpec = (
+    ('price_change_pct', 2), ('old_price', None),
+    ('new_price', None), ('window_seconds', None),
+)
+_IMBALANCE_DETAILS: DetailSpec = (
+    ('current_imbalance', 3), ('avg_imbalance', 3), ('imbalance_shift', 3),
+    ('bid_volume', None), ('ask_volume', None),
+)
+_COMPRESSION_DETAILS: DetailSpec = (
+    ('current_spread_pct', 3), ('avg_spread_pct', 3), ('compression_pct', 1),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class PriceSnapshot:
     """Point-in-time price data for a token."""
     timestamp: float
@@ -31,6 +46,144 @@ class PriceSnapshot:
     ask_volume: float
 
 
+class TokenHistory:
+    """
+    Rolling price history of one token, stored column-wise.
+
+    Each field of PriceSnapshot lives in its own preallocated array('d')
+    ring buffer, so a tick writes seven floats in place instead of
+    allocating a snapshot object, and detectors read plain float columns.
+
+    Running sums over the last WINDOW ticks (spread, and the per-tick
+    orderbook imbalance of ticks that had volume) are updated on push,
+    so the window means are O(1) reads.
+    """
+
+    WINDOW = 30
+    RESYNC_INTERVAL = 1000  # Pushes between exact recomputations of the sums
+
+    __slots__ = (
+        'capacity', 'count', '_next', '_pushes',
+        'timestamps', 'midpoints', 'best_bids', 'best_asks',
+        'spreads', 'bid_volumes', 'ask_volumes', 'imbalances',
+        '_spread_sum', '_imbalance_sum', '_imbalance_n',
+    )
+
+    def __init__(self, capacity: int):
+        self.capacity = max(capacity, self.WINDOW)
+        capacity = self.capacity
+        self.count = 0
+        self._next = 0  # Physical index of the next write
+        self._pushes = 0
+        zeros = bytes(8 * capacity)
+        self.timestamps = array('d', zeros)
+        self.midpoints = array('d', zeros)
+        self.best_bids = array('d', zeros)
+        self.best_asks = array('d', zeros)
+        self.spreads = array('d', zeros)
+        self.bid_volumes = array('d', zeros)
+        self.ask_volumes = array('d', zeros)
+        # (bid - ask) / (bid + ask) per tick; NaN when the book had no volume
+        self.imbalances = array('d', zeros)
+
+        self._spread_sum = 0.0
+        self._imbalance_sum = 0.0
+        self._imbalance_n = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def push(
+        self,
+        timestamp: float,
+        midpoint: float,
+        best_bid: float,
+        best_ask: float,
+        spread_pct: float,
+        bid_volume: float,
+        ask_volume: float
+    ) -> None:
+        """Append one tick, overwriting the oldest once full."""
+        if self.count >= self.WINDOW:
+            # Tick leaving the rolling window
+            j = self._next - self.WINDOW
+            self._spread_sum -= self.spreads[j]
+            old_imbalance = self.imbalances[j]
+            if old_imbalance == old_imbalance:  # not NaN
+                self._imbalance_sum -= old_imbalance
+                self._imbalance_n -= 1
+
+        total_volume = bid_volume + ask_volume
+        imbalance = (bid_volume - ask_volume) / total_volume if total_volume > 0 else math.nan
+
+        i = self._next
+        self.timestamps[i] = timestamp
+        self.midpoints[i] = midpoint
+        self.best_bids[i] = best_bid
+        self.best_asks[i] = best_ask
+        self.spreads[i] = spread_pct
+        self.bid_volumes[i] = bid_volume
+        self.ask_volumes[i] = ask_volume
+        self.imbalances[i] = imbalance
+        self._next = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+        self._spread_sum += spread_pct
+        if imbalance == imbalance:
+            self._imbalance_sum += imbalance
+            self._imbalance_n += 1
+
+        self._pushes += 1
+        if self._pushes % self.RESYNC_INTERVAL == 0:
+            self._resync()
+
+    def _resync(self) -> None:
+        """Recompute the window sums from the buffers to shed float drift."""
+        self._spread_sum = sum(self.tail(self.spreads, self.WINDOW))
+        recent = [x for x in self.tail(self.imbalances, self.WINDOW) if x == x]
+        self._imbalance_sum = sum(recent)
+        self._imbalance_n = len(recent)
+
+    def window_spread_mean(self) -> float:
+        """Mean spread_pct over the last WINDOW ticks (history must be non-empty)."""
+        return self._spread_sum / min(self.count, self.WINDOW)
+
+    def window_imbalance_mean(self) -> Optional[float]:
+        """Mean imbalance over ticks with volume in the last WINDOW, if any."""
+        if not self._imbalance_n:
+            return None
+        return self._imbalance_sum / self._imbalance_n
+
+    def latest(self, column: array) -> float:
+        """Most recent value of a column."""
+        return column[self._next - 1]
+
+    def oldest(self, column: array) -> float:
+        """Oldest retained value of a column."""
+        return column[(self._next - self.count) % self.capacity]
+
+    def tail(self, column: array, n: int) -> array:
+        """Last n values of a column (fewer if not filled), oldest first."""
+        n = min(n, self.count)
+        start = self._next - n
+        if start >= 0:
+            return column[start:self._next]
+        # Wrapped: end of the buffer followed by its beginning
+        return column[start + self.capacity:] + column[:self._next]
+
+    def snapshots(self) -> List[PriceSnapshot]:
+        """Materialize the history as PriceSnapshot objects, oldest first."""
+        columns = (
+            self.timestamps, self.midpoints, self.best_bids, self.best_asks,
+            self.spreads, self.bid_volumes, self.ask_volumes,
+        )
+        return [
+            PriceSnapshot(*row)
+            for row in zip(*(self.tail(column, self.count) for column in columns))
+        ]
+
+
 class PolymarketPriceMonitor(BaseFeed):
     """
     Monitors Polymarket prices for significant movements.
@@ -40,8 +193,22 @@ class PolymarketPriceMonitor(BaseFeed):
     2. Volume Spike: Volume > Z standard deviations from mean
     3. Imbalance Shift: Orderbook imbalance crosses threshold
     4. Spread Compression: Rapid spread narrowing (usually precedes move)
+
+    The poll loop is gather-heavy and expects to run on uvloop, which
+    main.py installs as the event loop policy when it is available.
     """
 
+    # Ticks required before the imbalance/spread detectors run
+    MIN_WINDOW_TICKS = 10
+
+    # Adaptive polling: interval = base * QUIET_STRETCH / (1 + RATE_GAIN * rate),
+    # where rate is an EWMA of triggers/sec over ~RATE_HORIZON_SEC
+    QUIET_STRETCH = 2.0
+    RATE_GAIN = 10.0
+    RATE_HORIZON_SEC = 60.0
+    MIN_POLL_INTERVAL = 0.1
+    MAX_POLL_INTERVAL = 5.0
+
     def __init__(
         self,
         clob_adapter,
@@ -55,9 +222,10 @@ class PolymarketPriceMonitor(BaseFeed):
         self._scanner = market_scanner
         self._audit = audit_logger
         self._poll_interval = poll_interval
+        self._trigger_rate = 0.0  # EWMA of emitted triggers per second
 
         # Price history per token (rolling window)
-        self._price_history: Dict[str, deque] = {}
+        self._price_history: Dict[str, TokenHistory] = {}
         self._history_window = 300  # 5 minutes of history
 
         # Detection thresholds (configurable)
@@ -69,18 +237,25 @@ class PolymarketPriceMonitor(BaseFeed):
             'spread_compression_pct': 50,  # Spread narrows by 50%
             'min_confidence': 0.5          # Minimum confidence to emit
         }
+        self._apply_thresholds()
 
         # Tracking for volume baseline
         self._volume_baseline: Dict[str, List[float]] = {}
 
         # Active monitoring tokens
         self._monitored_tokens: List[str] = []
+        self._monitored_set: Set[str] = set()  # O(1) membership companion
+
+        # Caps concurrent orderbook requests per poll (server politeness)
+        self._fetch_semaphore = asyncio.Semaphore(50)
 
     async def _monitor_loop(self) -> None:
         """Main monitoring loop."""
         self._audit.log_system_event("POLYMARKET_MONITOR_STARTED")
 
+        last_poll = time.monotonic()
         while self._running:
+            triggers = []
             try:
                 # 1. Update monitored tokens from market scanner
                 await self._update_monitored_tokens()
@@ -95,16 +270,31 @@ class PolymarketPriceMonitor(BaseFeed):
             except Exception as e:
                 self._audit.log_error("POLYMARKET_MONITOR_ERROR", str(e))
 
-            await asyncio.sleep(self._poll_interval)
+            now = time.monotonic()
+            await asyncio.sleep(self._next_poll_interval(len(triggers), now - last_poll))
+            last_poll = now
 
         self._audit.log_system_event("POLYMARKET_MONITOR_STOPPED")
 
+    def _next_poll_interval(self, trigger_count: int, elapsed: float) -> float:
+        """
+        Fold the last poll into the trigger-rate EWMA and derive the next sleep:
+        quiet markets stretch the interval, trigger bursts shrink it.
+        """
+        if elapsed > 0:
+            alpha = 1.0 - math.exp(-elapsed / self.RATE_HORIZON_SEC)
+            self._trigger_rate += alpha * (trigger_count / elapsed - self._trigger_rate)
+
+        interval = self._poll_interval * self.QUIET_STRETCH / (1.0 + self.RATE_GAIN * self._trigger_rate)
+        return min(self.MAX_POLL_INTERVAL, max(self.MIN_POLL_INTERVAL, interval))
+
     async def _update_monitored_tokens(self) -> None:
         """Update list of tokens to monitor from market scanner."""
         # Get top markets from scanner
         if self._scanner:
             top_markets = self._scanner.get_top_markets_for_fr(limit=30)
             self._monitored_tokens = [m.token_id for m in top_markets]
+            self._monitored_set = set(self._monitored_tokens)
 
     async def check_now(self) -> List[FeedTrigger]:
         """Perform immediate check on all monitored tokens."""
@@ -113,62 +303,90 @@ class PolymarketPriceMonitor(BaseFeed):
         if not self._monitored_tokens:
             return triggers
 
-        # v3.0: Fetch orderbooks in parallel (larger batches for speed)
-        batch_size = 20  # Increased from 10
-        for i in range(0, len(self._monitored_tokens), batch_size):
-            batch = self._monitored_tokens[i:i+batch_size]
-
-            tasks = [self._clob.get_orderbook(token_id) for token_id in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for token_id, book in zip(batch, results):
-                if isinstance(book, Exception) or book is None:
-                    continue
-
-                # Record price snapshot
-                snapshot = PriceSnapshot(
-                    timestamp=time.time(),
-                    midpoint=book.midpoint,
-                    best_bid=book.best_bid,
-                    best_ask=book.best_ask,
-                    spread_pct=book.spread_percent,
-                    bid_volume=sum(float(b[1]) for b in book.bids[:5]) if book.bids else 0,
-                    ask_volume=sum(float(a[1]) for a in book.asks[:5]) if book.asks else 0
-                )
-
-                # Store in history
-                if token_id not in self._price_history:
-                    self._price_history[token_id] = deque(maxlen=self._history_window)
-                self._price_history[token_id].append(snapshot)
-
-                # Run detection algorithms
-                detected = self._detect_triggers(token_id, snapshot)
-                triggers.extend(detected)
+        tokens = list(self._monitored_tokens)
+        results = await self._fetch_orderbooks(tokens)
+        # One clock read per poll: the batch is contemporaneous within the RTT
+        now = time.time()
+
+        updated = []
+        for token_id, book in zip(tokens, results):
+            if isinstance(book, Exception) or book is None:
+                continue
+
+            # Record price snapshot
+            history = self._price_history.get(token_id)
+            if history is None:
+                history = self._price_history[token_id] = TokenHistory(self._history_window)
+            history.push(
+                now,
+                book.midpoint,
+                book.best_bid,
+                book.best_ask,
+                book.spread_percent,
+                book.bid_volume_top5,
+                book.ask_volume_top5
+            )
+            updated.append((token_id, history))
+
+        # Run detection algorithms inline: the detectors are O(1) pure Python,
+        # so a worker thread would only add a hop under the GIL
+        return self._detect_all(updated)
+
+    def _detect_all(self, updated: List[tuple]) -> List[FeedTrigger]:
+        """Run detection on every (token_id, history) pair of a poll."""
+        triggers = []
+        for token_id, history in updated:
+            triggers.extend(self._detect_triggers(token_id, history))
+        return triggers
 
-            await asyncio.sleep(0.015)  # v3.0: Reduced delay between batches
+    async def _fetch_orderbooks(self, tokens: List[str]) -> list:
+        """
+        Fetch the books of all tokens, in token order.
+        Prefers the adapter's multi-book endpoint (one round trip per batch);
+        falls back to concurrent single-book requests if it is unavailable.
+        """
+        get_orderbooks = getattr(self._clob, 'get_orderbooks', None)
+        if get_orderbooks is not None:
+            books = await get_orderbooks(tokens)
+            if books is not None:
+                return [books.get(token_id) for token_id in tokens]
+
+        # Fetch every orderbook concurrently in one gather; the semaphore
+        # bounds in-flight requests instead of sleeping between batches
+        return await asyncio.gather(
+            *(self._fetch_orderbook(token_id) for token_id in tokens),
+            return_exceptions=True
+        )
 
-        return triggers
+    async def _fetch_orderbook(self, token_id: str):
+        """Fetch one orderbook under the shared concurrency cap."""
+        async with self._fetch_semaphore:
+            return await self._clob.get_orderbook(token_id)
 
-    def _detect_triggers(self, token_id: str, current: PriceSnapshot) -> List[FeedTrigger]:
-        """Run all detection algorithms on a token."""
+    def _detect_triggers(self, token_id: str, history: TokenHistory) -> List[FeedTrigger]:
+        """Run all detection algorithms on a token (its latest tick is current)."""
         triggers = []
-        history = self._price_history.get(token_id, deque())
 
-        if len(history) < 2:
+        count = len(history)
+        if count < 2:
             return triggers
 
         # 1. Price Spike Detection
-        spike_trigger = self._detect_price_spike(token_id, current, history)
+        spike_trigger = self._detect_price_spike(token_id, history)
         if spike_trigger:
             triggers.append(spike_trigger)
 
+        # The window-based detectors need MIN_WINDOW_TICKS of history
+        if count < self.MIN_WINDOW_TICKS:
+            return triggers
+
         # 2. Imbalance Shift Detection
-        imbalance_trigger = self._detect_imbalance_shift(token_id, current, history)
+        imbalance_trigger = self._detect_imbalance_shift(token_id, history)
         if imbalance_trigger:
             triggers.append(imbalance_trigger)
 
         # 3. Spread Compression Detection
-        spread_trigger = self._detect_spread_compression(token_id, current, history)
+        spread_trigger = self._detect_spread_compression(token_id, history)
         if spread_trigger:
             triggers.append(spread_trigger)
 
@@ -177,27 +395,29 @@ class PolymarketPriceMonitor(BaseFeed):
     def _detect_price_spike(
         self,
         token_id: str,
-        current: PriceSnapshot,
-        history: deque
+        history: TokenHistory
     ) -> Optional[FeedTrigger]:
         """Detect rapid price movements."""
-        threshold = self._thresholds['price_spike_pct'] / 100
-        window = self._thresholds['price_spike_window_sec']
+        threshold = self._spike_pct
+        window = self._spike_window
+
+        now = history.latest(history.timestamps)
+        current_price = history.latest(history.midpoints)
 
-        # Find price from window seconds ago
-        cutoff_time = current.timestamp - window
+        # Reference price: the first (oldest) snapshot at or before the
+        # cutoff. Ticks are appended in time order, so that snapshot exists
+        # iff the oldest retained one qualifies - no scan needed.
+        cutoff_time = now - window
         old_price = None
 
-        for snap in history:
-            if snap.timestamp <= cutoff_time:
-                old_price = snap.midpoint
-                break
+        if history.oldest(history.timestamps) <= cutoff_time:
+            old_price = history.oldest(history.midpoints)
 
         if old_price is None or old_price == 0:
             return None
 
         # Calculate change
-        price_change = (current.midpoint - old_price) / old_price
+        price_change = (current_price - old_price) / old_price
 
         if abs(price_change) < threshold:
             return None
@@ -222,47 +442,33 @@ class PolymarketPriceMonitor(BaseFeed):
             direction=direction,
             expected_move_pct=abs(price_change) * 100 * 0.5,  # Expect 50% continuation
             source=self._name,
-            timestamp=current.timestamp,
-            details={
-                'price_change_pct': round(price_change * 100, 2),
-                'old_price': old_price,
-                'new_price': current.midpoint,
-                'window_seconds': window
-            }
+            timestamp=now,
+            detail_spec=_SPIKE_DETAILS,
+            detail_values=(price_change * 100, old_price, current_price, window)
         )
 
     def _detect_imbalance_shift(
         self,
         token_id: str,
-        current: PriceSnapshot,
-        history: deque
+        history: TokenHistory
     ) -> Optional[FeedTrigger]:
         """Detect significant orderbook imbalance changes."""
-        threshold = self._thresholds['imbalance_threshold']
+        threshold = self._imbalance_threshold
 
-        total_volume = current.bid_volume + current.ask_volume
+        bid_volume = history.latest(history.bid_volumes)
+        ask_volume = history.latest(history.ask_volumes)
+        total_volume = bid_volume + ask_volume
         if total_volume == 0:
             return None
 
         # Current imbalance (positive = more bids, negative = more asks)
-        current_imbalance = (current.bid_volume - current.ask_volume) / total_volume
+        current_imbalance = (bid_volume - ask_volume) / total_volume
 
-        # Compare to average imbalance over history
-        if len(history) < 10:
+        # Compare to the average over the last 30 snapshots (incremental)
+        avg_imbalance = history.window_imbalance_mean()
+        if avg_imbalance is None:
             return None
 
-        historical_imbalances = []
-        for snap in list(history)[-30:]:  # Last 30 snapshots
-            total = snap.bid_volume + snap.ask_volume
-            if total > 0:
-                historical_imbalances.append(
-                    (snap.bid_volume - snap.ask_volume) / total
-                )
-
-        if not historical_imbalances:
-            return None
-
-        avg_imbalance = sum(historical_imbalances) / len(historical_imbalances)
         imbalance_shift = current_imbalance - avg_imbalance
 
         # Check if shift is significant
@@ -289,46 +495,42 @@ class PolymarketPriceMonitor(BaseFeed):
             direction=direction,
             expected_move_pct=abs(imbalance_shift) * 5,  # Rough estimate
             source=self._name,
-            timestamp=current.timestamp,
-            details={
-                'current_imbalance': round(current_imbalance, 3),
-                'avg_imbalance': round(avg_imbalance, 3),
-                'imbalance_shift': round(imbalance_shift, 3),
-                'bid_volume': current.bid_volume,
-                'ask_volume': current.ask_volume
-            }
+            timestamp=history.latest(history.timestamps),
+            detail_spec=_IMBALANCE_DETAILS,
+            detail_values=(
+                current_imbalance, avg_imbalance, imbalance_shift,
+                bid_volume, ask_volume
+            )
         )
 
     def _detect_spread_compression(
         self,
         token_id: str,
-        current: PriceSnapshot,
-        history: deque
+        history: TokenHistory
     ) -> Optional[FeedTrigger]:
         """Detect rapid spread narrowing (often precedes breakout)."""
-        threshold = self._thresholds['spread_compression_pct'] / 100
-
-        if len(history) < 10:
-            return None
+        threshold = self._compression_pct
 
-        # Average spread over last 30 snapshots
-        recent_spreads = [snap.spread_pct for snap in list(history)[-30:]]
-        avg_spread = sum(recent_spreads) / len(recent_spreads)
+        # Average spread over last 30 snapshots, maintained incrementally
+        avg_spread = history.window_spread_mean()
 
         if avg_spread == 0:
             return None
 
         # Check for compression
-        compression = (avg_spread - current.spread_pct) / avg_spread
+        current_spread = history.latest(history.spreads)
+        compression = (avg_spread - current_spread) / avg_spread
 
         if compression < threshold:
             return None
 
         # Spread compression doesn't give us direction, but it signals
         # that a move is coming. Use imbalance for direction hint.
-        total_vol = current.bid_volume + current.ask_volume
+        bid_volume = history.latest(history.bid_volumes)
+        ask_volume = history.latest(history.ask_volumes)
+        total_vol = bid_volume + ask_volume
         if total_vol > 0:
-            imbalance = (current.bid_volume - current.ask_volume) / total_vol
+            imbalance = (bid_volume - ask_volume) / total_vol
             direction = "BUY" if imbalance > 0 else "SELL"
         else:
             direction = "BUY"  # Default
@@ -344,12 +546,9 @@ class PolymarketPriceMonitor(BaseFeed):
             direction=direction,
             expected_move_pct=compression * 10,  # Rough estimate
             source=self._name,
-            timestamp=current.timestamp,
-            details={
-                'current_spread_pct': round(current.spread_pct, 3),
-                'avg_spread_pct': round(avg_spread, 3),
-                'compression_pct': round(compression * 100, 1)
-            }
+            timestamp=history.latest(history.timestamps),
+            detail_spec=_COMPRESSION_DETAILS,
+            detail_values=(current_spread, avg_spread, compression * 100)
         )
 
     def configure(self, thresholds: dict) -> None:
@@ -357,16 +556,26 @@ class PolymarketPriceMonitor(BaseFeed):
         for key in thresholds:
             if key in self._thresholds:
                 self._thresholds[key] = thresholds[key]
+        self._apply_thresholds()
 
         self._audit.log_system_event("POLYMARKET_MONITOR_CONFIGURED", self._thresholds)
 
+    def _apply_thresholds(self) -> None:
+        """Cache the detector thresholds as plain attributes (fractions precomputed)."""
+        self._spike_pct = self._thresholds['price_spike_pct'] / 100
+        self._spike_window = self._thresholds['price_spike_window_sec']
+        self._imbalance_threshold = self._thresholds['imbalance_threshold']
+        self._compression_pct = self._thresholds['spread_compression_pct'] / 100
+
     def set_monitored_tokens(self, tokens: List[str]) -> None:
         """Manually set tokens to monitor."""
         self._monitored_tokens = tokens
+        self._monitored_set = set(tokens)
 
     def add_monitored_token(self, token_id: str) -> None:
         """Add a single token to monitor."""
-        if token_id not in self._monitored_tokens:
+        if token_id not in self._monitored_set:
+            self._monitored_set.add(token_id)
             self._monitored_tokens.append(token_id)
 
     @property
@@ -376,4 +585,5 @@ class PolymarketPriceMonitor(BaseFeed):
 
     def get_price_history(self, token_id: str) -> List[PriceSnapshot]:
         """Get price history for a token."""
-        return list(self._price_history.get(token_id, []))
+        history = self._price_history.get(token_id)
+        return history.snapshots() if history is not None else []
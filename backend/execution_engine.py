@@ -10,24 +10,31 @@ v2.5 Optimizations:
 """
 
 from enum import Enum
+from types import MappingProxyType
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Callable, List
 import asyncio
+import itertools
 import time
-import random
+from random import random as _rand, randint as _randint, uniform as _uniform
+
+# Pre-bound clocks: monotonic ns for internal bookkeeping, wall time for results
+_mono_ns = time.monotonic_ns
+_wall = time.time
 
 from .audit_logger import AuditLogger
 from .rate_limiter import RateLimiter
 from py_clob_client.client import ClobClient, ApiCreds
 from py_clob_client.clob_types import OrderArgs
 
-
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents a position entry for PnL tracking."""
     price: float
     size: float
-    timestamp: float
+    timestamp: int  # time.monotonic_ns() at fill; only used for ordering/ageing
     order_id: str
 
 # Import for type hint only - avoid circular import
@@ -45,7 +52,7 @@ class OrderStatus(Enum):
     FAILED = "FAILED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Represents an order to execute."""
     order_id: str
@@ -60,13 +67,34 @@ class ExecutionEngine:
     """
     Async Execution Engine.
     Processes orders from a queue asynchronously.
+
+    Order state (orders, id sets, counters, positions) is confined to the
+    event loop thread, so it takes no lock: submit/cancel/status callbacks
+    all run on the loop, and the CLOB pool threads only run _send_clob_order.
     """
+
+    # Finished orders kept for get_order() before the oldest are evicted
+    MAX_FINISHED_ORDERS = 10_000
+    # Orders drained from the queue per batch / executed concurrently
+    MAX_BATCH = 64
+    MAX_CONCURRENT_ORDERS = 32
+    # Queued orders beyond which submit_order pushes back (QueueFull)
+    DEFAULT_QUEUE_SIZE = 10_000
     
     def __init__(self, audit_logger: AuditLogger):
         self._audit = audit_logger
         self._orders: dict[str, Order] = {}
-        self._order_queue: asyncio.Queue = asyncio.Queue()
-        self._order_counter = 0
+        self._order_queue: asyncio.Queue = asyncio.Queue(maxsize=self.DEFAULT_QUEUE_SIZE)
+        self._order_ids = itertools.count(1)  # monotonic order numbering
+        # Live order ids by status, updated on every transition so that
+        # pending/cancel paths never scan the full order history
+        self._pending_ids: set[str] = set()
+        self._executing_ids: set[str] = set()
+        # Finished ids, oldest first: overflow evicts the oldest from _orders
+        self._completed_ring: deque[str] = deque(maxlen=self.MAX_FINISHED_ORDERS)
+        # Cumulative counters, unaffected by eviction (execution_stats)
+        self._status_counts: Counter = Counter()  # finished orders by status
+        self._submitted_count = 0  # orders accepted by submit_order
         self._enabled = False
         self._credentials: "CredentialsManager | None" = None
         self._clob_client: ClobClient | None = None
@@ -80,11 +108,21 @@ class ExecutionEngine:
 
         self._status_callbacks: list[Callable[[Order], None]] = []
         self._processing_task: asyncio.Task | None = None
+        self._exec_sem: asyncio.Semaphore | None = None
+        # Dedicated pool for blocking CLOB HTTP calls (created in enable())
+        self._clob_pool: ThreadPoolExecutor | None = None
+        self._clob_workers = 64
 
         # v2.5: Position tracking for PnL calculation (FIFO)
-        self._positions: dict[str, List[Position]] = {}  # token_id -> [Position entries]
+        self._positions: dict[str, deque[Position]] = {}  # token_id -> FIFO of Position entries
+        # Running open size / cost basis per token, kept in step with _positions
+        self._pos_size: dict[str, float] = {}
+        self._pos_cost: dict[str, float] = {}
         self._realized_pnl: dict[str, float] = {}  # token_id -> cumulative PnL
         self._total_realized_pnl: float = 0.0
+        # Zero-copy read-only views handed out to observers (UI polling)
+        self._positions_view = MappingProxyType(self._positions)
+        self._realized_pnl_view = MappingProxyType(self._realized_pnl)
 
         # v3.0: Paper trading simulation config (enhanced)
         self._paper_config = {
@@ -99,11 +137,16 @@ class ExecutionEngine:
             'depth_impact_factor': 0.0005  # Market impact factor
         }
     
-    def configure_api(self, host: str, chain_id: int = 137, paper_trading: bool = False):
+    def configure_api(self, host: str, chain_id: int = 137, paper_trading: bool = False,
+                      clob_workers: int = 64, queue_size: int = DEFAULT_QUEUE_SIZE):
         """Configure CLOB API connection settings."""
         self._host = host
         self._chain_id = chain_id
         self._paper_trading = paper_trading
+        self._clob_workers = clob_workers
+        # Resize only while nothing is queued (never drop submitted orders)
+        if queue_size != self._order_queue.maxsize and self._order_queue.empty():
+            self._order_queue = asyncio.Queue(maxsize=queue_size)
     
     def set_credentials(self, credentials_manager: "CredentialsManager") -> None:
         """Set credentials manager."""
@@ -119,6 +162,11 @@ class ExecutionEngine:
             
         self._enabled = True
         self._init_client()
+        self._exec_sem = asyncio.Semaphore(self.MAX_CONCURRENT_ORDERS)
+        if self._clob_client:
+            self._clob_pool = ThreadPoolExecutor(
+                max_workers=self._clob_workers, thread_name_prefix="clob"
+            )
         # Start the background processor
         self._processing_task = asyncio.create_task(self._process_queue())
         self._audit.log_operator_action("EXECUTION_ENGINE_ENABLED")
@@ -163,6 +211,9 @@ class ExecutionEngine:
         if self._processing_task:
             self._processing_task.cancel()
             self._processing_task = None
+        if self._clob_pool:
+            self._clob_pool.shutdown(wait=False)
+            self._clob_pool = None
         self._clob_client = None
         self._audit.log_operator_action("EXECUTION_ENGINE_DISABLED")
     
@@ -175,8 +226,7 @@ class ExecutionEngine:
             self._audit.log_policy_violation("SUBMIT_ORDER", "Execution engine is disabled")
             return None
         
-        self._order_counter += 1
-        order_id = f"ORD-{self._order_counter:06d}"
+        order_id = f"ORD-{next(self._order_ids):06d}"
         
         order = Order(
             order_id=order_id,
@@ -187,6 +237,7 @@ class ExecutionEngine:
         )
         
         self._orders[order_id] = order
+        self._pending_ids.add(order_id)
         # Put in queue (nowait because we are likely in sync context calling this, or async)
         # However, submit_order is called by sync strategies currently. 
         # We need a way to put into the loop from sync land if strategy is sync.
@@ -196,8 +247,12 @@ class ExecutionEngine:
         try:
             self._order_queue.put_nowait(order_id)
         except asyncio.QueueFull:
+            # Backpressure: the order was never queued, so forget it
+            del self._orders[order_id]
+            self._pending_ids.discard(order_id)
             self._audit.log_error("QUEUE_FULL", "Order queue is full")
             return None
+        self._submitted_count += 1
         
         self._audit.log_strategy_event(strategy, "ORDER_SUBMITTED", {
             "order_id": order_id,
@@ -210,14 +265,57 @@ class ExecutionEngine:
         """Background loop to process orders."""
         while self._enabled:
             try:
-                order_id = await self._order_queue.get()
-                await self._execute_order(order_id)
-                self._order_queue.task_done()
+                # Wait for one order, then drain whatever else is already queued
+                batch = [await self._order_queue.get()]
+                while len(batch) < self.MAX_BATCH:
+                    try:
+                        batch.append(self._order_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                try:
+                    errors = await self._execute_batch(batch)
+                finally:
+                    for _ in batch:
+                        self._order_queue.task_done()
+
+                if errors:
+                    for e in errors:
+                        self._audit.log_error("QUEUE_PROCESS_ERROR", str(e))
+                    await asyncio.sleep(1) # Backoff
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self._audit.log_error("QUEUE_PROCESS_ERROR", str(e))
                 await asyncio.sleep(1) # Backoff
+
+    async def _execute_batch(self, batch: list[str]) -> list[Exception]:
+        """
+        Execute a drained batch concurrently and return the errors raised.
+        Orders on the same token stay sequential in submission order, so a
+        SELL never overtakes the BUY it closes.
+        """
+        lanes: dict[str, list[str]] = {}
+        for order_id in batch:
+            order = self._orders.get(order_id)
+            token_id = order.params.get('token_id', '') if order else ''
+            lanes.setdefault(token_id, []).append(order_id)
+
+        lane_errors = await asyncio.gather(
+            *(self._execute_lane(order_ids) for order_ids in lanes.values())
+        )
+        return [e for errors in lane_errors for e in errors]
+
+    async def _execute_lane(self, order_ids: list[str]) -> list[Exception]:
+        """Execute one token's orders in order, each under the concurrency cap."""
+        errors = []
+        for order_id in order_ids:
+            try:
+                async with self._exec_sem:
+                    await self._execute_order(order_id)
+            except Exception as e:
+                errors.append(e)
+        return errors
     
     async def _execute_order(self, order_id: str) -> bool:
         """
@@ -226,11 +324,13 @@ class ExecutionEngine:
         order = self._orders.get(order_id)
         if not order:
             return False
-            
+
         if order.status != OrderStatus.PENDING:
             return False
         
         order.status = OrderStatus.EXECUTING
+        self._pending_ids.discard(order_id)
+        self._executing_ids.add(order_id)
         self._audit.log_strategy_event(order.strategy, "ORDER_EXECUTING", {"order_id": order_id})
         
         loop = asyncio.get_running_loop()
@@ -268,7 +368,7 @@ class ExecutionEngine:
                 await self._rate_limiter.acquire()
                 
                 # Run blocking CLOB call in executor
-                resp = await loop.run_in_executor(None, self._send_clob_order, order)
+                resp = await loop.run_in_executor(self._clob_pool, self._send_clob_order, order)
                 result_data = {'clob_response': str(resp)}
                 execution_success = True
             except Exception as e:
@@ -279,9 +379,19 @@ class ExecutionEngine:
              result_data = {'error': 'No active CLOB client'}
              execution_success = False
              
-        order.status = OrderStatus.COMPLETED if execution_success else OrderStatus.FAILED
+        final_status = OrderStatus.COMPLETED if execution_success else OrderStatus.FAILED
+        if order_id in self._executing_ids:
+            order.status = final_status
+            self._executing_ids.discard(order_id)
+            self._retire(order_id)
+        else:
+            # Cancelled mid-flight (already retired): the call still went
+            # through, so move its count over to the real outcome
+            self._status_counts[order.status] -= 1
+            self._status_counts[final_status] += 1
+            order.status = final_status
         order.result = result_data
-        order.result["timestamp"] = time.time()
+        order.result["timestamp"] = _wall()
         
         self._audit.log_strategy_event(order.strategy, "ORDER_COMPLETED", {
             "order_id": order_id, 
@@ -291,45 +401,68 @@ class ExecutionEngine:
         self._notify_status(order)
         return True
 
-    def _send_clob_order(self, order: Order):
-        """Sync function to be run in executor."""
-        if not self._clob_client:
-            raise Exception("Client not initialized")
-            
+    @staticmethod
+    def _order_args(order: Order) -> OrderArgs:
         token_id = order.params.get('token_id')
         price = float(order.params.get('price'))
         size = float(order.params.get('size'))
         side = "BUY" if order.params.get('side', 'BUY').upper() == "BUY" else "SELL"
         
-        order_args = OrderArgs(
+        return OrderArgs(
             price=price,
             size=size,
             side=side,
             token_id=token_id
         )
-        return self._clob_client.create_and_post_order(order_args)
-    
+
+    def _send_clob_order(self, order: Order):
+        """Sync function to be run in executor."""
+        if not self._clob_client:
+            raise Exception("Client not initialized")
+            
+        return self._clob_client.create_and_post_order(self._order_args(order))
+
     def cancel_order(self, order_id: str) -> bool:
         """Cancel order (stub for now)."""
         # In async world, we'd add a cancellation task or flag.
         order = self._orders.get(order_id)
         if order and order.status in [OrderStatus.PENDING, OrderStatus.EXECUTING]:
             order.status = OrderStatus.CANCELLED
+            self._pending_ids.discard(order_id)
+            self._executing_ids.discard(order_id)
+            self._retire(order_id)
             self._audit.log_strategy_event(order.strategy, "ORDER_CANCELLED", {"order_id": order_id})
             return True
         return False
 
     def cancel_all_orders(self) -> int:
         """Cancel all."""
-        cancelled = 0
-        for order in self._orders.values():
-            if order.status in [OrderStatus.PENDING, OrderStatus.EXECUTING]:
-                order.status = OrderStatus.CANCELLED
-                cancelled += 1
-        return cancelled
+        live_ids = self._pending_ids | self._executing_ids
+        self._pending_ids.clear()
+        self._executing_ids.clear()
+        for order_id in live_ids:
+            self._orders[order_id].status = OrderStatus.CANCELLED
+            self._retire(order_id)
+        return len(live_ids)
+
+    def _retire(self, order_id: str) -> None:
+        """Count a finished order, evicting the oldest beyond MAX_FINISHED_ORDERS."""
+        self._status_counts[self._orders[order_id].status] += 1
+        ring = self._completed_ring
+        if len(ring) == ring.maxlen:
+            self._orders.pop(ring[0], None)
+        ring.append(order_id)
 
     def get_order(self, order_id: str) -> Order | None:
+        """
+        Look up an order. Live orders are always found; finished ones only
+        until MAX_FINISHED_ORDERS newer orders have finished (None after).
+        """
         return self._orders.get(order_id)
+
+    def get_pending_orders(self) -> list[Order]:
+        """Orders still waiting in the queue (O(pending), not O(history))."""
+        return [self._orders[order_id] for order_id in self._pending_ids]
         
     def subscribe_status(self, callback: Callable[[Order], None]) -> None:
         self._status_callbacks.append(callback)
@@ -347,7 +480,7 @@ class ExecutionEngine:
     
     @property
     def pending_count(self) -> int:
-        return sum(1 for o in self._orders.values() if o.status == OrderStatus.PENDING)
+        return len(self._pending_ids)
 
     # ============= v2.5: Paper Trading Simulation =============
 
@@ -357,17 +490,25 @@ class ExecutionEngine:
         Returns a dict with execution details.
         """
         cfg = self._paper_config
-        token_id = order.params.get('token_id', '')
-        price = float(order.params.get('price', 0))
-        size = float(order.params.get('size', 0))
-        side = order.params.get('side', 'BUY').upper()
+        params = order.params
+        price = float(params.get('price', 0))
+        size = float(params.get('size', 0))
+        side = params.get('side', 'BUY').upper()
 
         # 1. Simulate network latency (50-200ms)
-        latency = random.randint(cfg['latency_min_ms'], cfg['latency_max_ms']) / 1000.0
+        latency = _randint(cfg['latency_min_ms'], cfg['latency_max_ms']) / 1000.0
         await asyncio.sleep(latency)
 
+        # Config read once, after the await (configure_paper_trading may run meanwhile)
+        fill_probability = cfg['fill_probability']
+        slippage_min = cfg['slippage_min']
+        slippage_max = cfg['slippage_max']
+        base_slippage = cfg['slippage_base']
+        size_factor = cfg['slippage_size_factor']
+        partial_fill_chance = cfg['partial_fill_chance']
+
         # 2. Check fill probability (simulates liquidity availability)
-        if random.random() > cfg['fill_probability']:
+        if _rand() > fill_probability:
             return {
                 'filled': False,
                 'reject_reason': 'INSUFFICIENT_LIQUIDITY',
@@ -377,12 +518,11 @@ class ExecutionEngine:
 
         # 3. v3.0: Calculate depth-based slippage
         # Base slippage + size impact + random market noise
-        base_slippage = cfg['slippage_base']
-        size_impact = (size / 100.0) * cfg['slippage_size_factor']  # Per $100 impact
-        market_noise = random.uniform(-0.0002, 0.0002)  # ±0.02% random noise
+        size_impact = (size / 100.0) * size_factor  # Per $100 impact
+        market_noise = _uniform(-0.0002, 0.0002)  # ±0.02% random noise
 
         # Total slippage bounded by min/max
-        slippage = max(cfg['slippage_min'], min(cfg['slippage_max'], base_slippage + size_impact + market_noise))
+        slippage = max(slippage_min, min(slippage_max, base_slippage + size_impact + market_noise))
 
         if side == 'BUY':
             # Buying costs more (price goes up)
@@ -394,14 +534,13 @@ class ExecutionEngine:
         # 4. Partial fill simulation
         fill_size = size
         is_partial = False
-        if random.random() < cfg['partial_fill_chance']:
-            fill_size = size * random.uniform(0.5, 0.95)
+        if _rand() < partial_fill_chance:
+            fill_size = size * _uniform(0.5, 0.95)
             is_partial = True
 
-        # 5. Calculate PnL if this is a closing trade
+        # 5. PnL of a closing trade is realized by _track_position once the
+        # fill is booked (single FIFO walk), so it starts at zero here
         pnl = 0.0
-        if side == 'SELL' and token_id in self._positions and self._positions[token_id]:
-            pnl = self._calculate_fifo_pnl(token_id, executed_price, fill_size)
 
         return {
             'filled': True,
@@ -424,54 +563,66 @@ class ExecutionEngine:
         executed_price = result.get('executed_price', 0)
         fill_size = result.get('fill_size', 0)
 
-        if token_id not in self._positions:
-            self._positions[token_id] = []
-
         if side == 'BUY':
             # Add new position entry
-            self._positions[token_id].append(Position(
+            self._positions.setdefault(token_id, deque()).append(Position(
                 price=executed_price,
                 size=fill_size,
-                timestamp=time.time(),
+                timestamp=_mono_ns(),
                 order_id=order.order_id
             ))
+            self._pos_size[token_id] = self._pos_size.get(token_id, 0.0) + fill_size
+            self._pos_cost[token_id] = self._pos_cost.get(token_id, 0.0) + fill_size * executed_price
         elif side == 'SELL':
-            # Remove from positions (FIFO) - already calculated PnL
-            self._consume_positions(token_id, fill_size)
+            # Consume positions (FIFO) and realize PnL in the same walk
+            pnl = self._consume_and_pnl(token_id, executed_price, fill_size)
+            result['pnl'] = round(pnl, 4)
 
-    def _calculate_fifo_pnl(self, token_id: str, sell_price: float, sell_size: float) -> float:
+    def _consume_and_pnl(self, token_id: str, sell_price: float, sell_size: float) -> float:
         """
-        Calculate PnL using FIFO (First In First Out) method.
+        Consume positions in FIFO (First In First Out) order after a sell and
+        realize the PnL of the consumed portions in the same pass.
         Returns the realized PnL for this sell.
         """
-        if token_id not in self._positions:
-            return 0.0
-
-        positions = self._positions[token_id]
+        positions = self._positions.get(token_id)
         if not positions:
             return 0.0
 
         remaining_to_sell = sell_size
         total_pnl = 0.0
         total_cost = 0.0
-        total_sold = 0.0
 
-        for pos in positions:
-            if remaining_to_sell <= 0:
-                break
+        # Only the consumed head entries are touched
+        while positions and remaining_to_sell > 0:
+            head = positions[0]
 
             # How much can we sell from this position?
-            sellable = min(pos.size, remaining_to_sell)
+            sellable = min(head.size, remaining_to_sell)
 
             # Cost basis for this portion
-            cost = sellable * pos.price
+            cost = sellable * head.price
             revenue = sellable * sell_price
-            pnl = revenue - cost
 
             total_cost += cost
-            total_sold += sellable
-            total_pnl += pnl
-            remaining_to_sell -= sellable
+            total_pnl += revenue - cost
+
+            if head.size <= remaining_to_sell:
+                # Fully consume this position
+                remaining_to_sell -= head.size
+                positions.popleft()
+            else:
+                # Partially consume this position
+                head.size -= remaining_to_sell
+                remaining_to_sell = 0
+
+        if positions:
+            self._pos_size[token_id] -= sell_size - remaining_to_sell
+            self._pos_cost[token_id] -= total_cost
+        else:
+            # Flat: drop the entry and totals rather than carry rounding residue
+            del self._positions[token_id]
+            self._pos_size.pop(token_id, None)
+            self._pos_cost.pop(token_id, None)
 
         # Update cumulative PnL tracking
         if token_id not in self._realized_pnl:
@@ -490,28 +641,6 @@ class ExecutionEngine:
 
         return total_pnl
 
-    def _consume_positions(self, token_id: str, size: float) -> None:
-        """Consume positions in FIFO order after a sell."""
-        if token_id not in self._positions:
-            return
-
-        remaining = size
-        new_positions = []
-
-        for pos in self._positions[token_id]:
-            if remaining <= 0:
-                new_positions.append(pos)
-            elif pos.size <= remaining:
-                # Fully consume this position
-                remaining -= pos.size
-            else:
-                # Partially consume this position
-                pos.size -= remaining
-                new_positions.append(pos)
-                remaining = 0
-
-        self._positions[token_id] = new_positions
-
     # ============= v2.5: PnL Accessors =============
 
     @property
@@ -520,22 +649,29 @@ class ExecutionEngine:
         return self._total_realized_pnl
 
     @property
-    def realized_pnl_by_token(self) -> dict[str, float]:
-        """Get realized PnL breakdown by token."""
-        return self._realized_pnl.copy()
+    def realized_pnl_by_token(self) -> MappingProxyType:
+        """Get realized PnL breakdown by token (live read-only view)."""
+        return self._realized_pnl_view
 
     @property
-    def open_positions(self) -> dict[str, List[Position]]:
-        """Get all open positions."""
-        return {k: v.copy() for k, v in self._positions.items() if v}
+    def open_positions(self) -> MappingProxyType:
+        """
+        Get all open positions (live read-only view, token_id -> FIFO deque).
+        Entries must not be mutated; use snapshot_positions() for a copy.
+        """
+        return self._positions_view
+
+    def snapshot_positions(self) -> dict[str, List[Position]]:
+        """Copy of all open positions."""
+        return {k: list(v) for k, v in self._positions.items()}
 
     def get_position_value(self, token_id: str, current_price: float) -> dict:
         """Calculate unrealized PnL for a specific token."""
-        if token_id not in self._positions or not self._positions[token_id]:
+        if not self._positions.get(token_id):
             return {'size': 0, 'cost_basis': 0, 'current_value': 0, 'unrealized_pnl': 0}
 
-        total_size = sum(p.size for p in self._positions[token_id])
-        total_cost = sum(p.size * p.price for p in self._positions[token_id])
+        total_size = self._pos_size[token_id]
+        total_cost = self._pos_cost[token_id]
         current_value = total_size * current_price
         unrealized_pnl = current_value - total_cost
 
@@ -566,8 +702,8 @@ class ExecutionEngine:
             if not positions:
                 continue
 
-            token_size = sum(p.size for p in positions)
-            token_cost = sum(p.size * p.price for p in positions)
+            token_size = self._pos_size[token_id]
+            token_cost = self._pos_cost[token_id]
             avg_price = token_cost / token_size if token_size > 0 else 0
 
             positions_data.append({
@@ -601,8 +737,8 @@ class ExecutionEngine:
                 continue
 
             current_price = current_prices[token_id]
-            token_size = sum(p.size for p in positions)
-            token_cost = sum(p.size * p.price for p in positions)
+            token_size = self._pos_size[token_id]
+            token_cost = self._pos_cost[token_id]
             current_value = token_size * current_price
             unrealized_pnl = current_value - token_cost
 
@@ -620,18 +756,19 @@ class ExecutionEngine:
 
     @property
     def execution_stats(self) -> dict:
-        """Get execution engine statistics."""
-        completed = sum(1 for o in self._orders.values() if o.status == OrderStatus.COMPLETED)
-        failed = sum(1 for o in self._orders.values() if o.status == OrderStatus.FAILED)
-        cancelled = sum(1 for o in self._orders.values() if o.status == OrderStatus.CANCELLED)
+        """Get execution engine statistics (cumulative, evicted orders included)."""
+        counts = self._status_counts
+        completed = counts[OrderStatus.COMPLETED]
+        failed = counts[OrderStatus.FAILED]
+        cancelled = counts[OrderStatus.CANCELLED]
 
         return {
-            'total_orders': len(self._orders),
+            'total_orders': self._submitted_count,
             'pending': self.pending_count,
             'completed': completed,
             'failed': failed,
             'cancelled': cancelled,
-            'success_rate': round((completed / len(self._orders)) * 100, 1) if self._orders else 0,
+            'success_rate': round((completed / self._submitted_count) * 100, 1) if self._submitted_count else 0,
             'total_realized_pnl': round(self._total_realized_pnl, 4),
             'paper_trading': getattr(self, '_paper_trading', False)
         }
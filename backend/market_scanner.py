@@ -162,8 +162,9 @@ class MarketScanner:
                         scored_markets.append(score)
                         self._scored_markets[score.token_id] = score
 
-                # v3.0: Reduced delay between batches
-                await asyncio.sleep(0.02)
+                # Yield to the loop between batches without arming a timer;
+                # the batch size already bounds in-flight requests
+                await asyncio.sleep(0)
 
             # 4. Sort by score descending
             scored_markets.sort(key=lambda m: m.score, reverse=True)
@@ -192,8 +193,8 @@ class MarketScanner:
         midpoint = book.midpoint
 
         # Calculate depth (sum of top 5 levels)
-        bid_depth = sum(float(b[1]) for b in book.bids[:5]) if book.bids else 0
-        ask_depth = sum(float(a[1]) for a in book.asks[:5]) if book.asks else 0
+        bid_depth = book.bid_volume_top5
+        ask_depth = book.ask_volume_top5
 
         # Calculate time to resolution (if end_date available)
         time_to_resolution_hours = 24 * 30  # Default 30 days
@@ -377,6 +377,7 @@ class Orchestrator:
         if self._credentials:
             self._credentials.lock_vault()
         self._audit.log_operator_action("SYSTEM_SHUTDOWN")
+        self._audit.close()
 
     def _start_heartbeat(self) -> None:
         """Start heartbeat monitoring thread with AsyncIO loop."""
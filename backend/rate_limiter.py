@@ -22,25 +22,32 @@ class RateLimiter:
         self._max_tokens = max_tokens
         self._refill_rate = refill_rate
         self._tokens = max_tokens
-        self._last_refill = time.time()
+        self._last_refill = time.monotonic()
+        # Held only by callers that must wait, so waiters are served in order
         self._lock = asyncio.Lock()
         
     async def acquire(self, tokens: float = 1.0) -> None:
         """
         Wait until enough tokens are available.
         """
-        while True:
-            async with self._lock:
+        # Fast path: nobody is waiting and the bucket has enough tokens.
+        # There is no await between refill and take, so this is atomic on the loop.
+        if not self._lock.locked():
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return
+
+        async with self._lock:
+            while True:
                 self._refill()
                 if self._tokens >= tokens:
                     self._tokens -= tokens
                     return
                 
-                # Calculate wait time
+                # Sleep exactly until the missing tokens have refilled
                 needed = tokens - self._tokens
-                wait_time = needed / self._refill_rate
-                
-            await asyncio.sleep(wait_time)
+                await asyncio.sleep(needed / self._refill_rate)
             
     def try_acquire(self, tokens: float = 1.0) -> bool:
         """
@@ -51,21 +58,14 @@ class RateLimiter:
         # Note: Mixing sync and async lock acquisition is tricky. 
         # For simplicity in this bot, we assume async usage mostly.
         # But if needed synchronously:
-        self._refill_sync()
+        self._refill()
         if self._tokens >= tokens:
             self._tokens -= tokens
             return True
         return False
 
     def _refill(self):
-        now = time.time()
-        elapsed = now - self._last_refill
-        added = elapsed * self._refill_rate
-        self._tokens = min(self._max_tokens, self._tokens + added)
-        self._last_refill = now
-        
-    def _refill_sync(self):
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self._last_refill
         added = elapsed * self._refill_rate
         self._tokens = min(self._max_tokens, self._tokens + added)
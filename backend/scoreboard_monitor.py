@@ -26,13 +26,14 @@ class ScoreboardMonitor:
     
     def __init__(self, audit_logger: AuditLogger):
         self._audit = audit_logger
-        self._subscribers: List[Callable[[ScoreboardTrigger], None]] = []
+        # (is_coroutine_function, callback), tagged once at subscribe time
+        self._subscribers: List[tuple[bool, Callable[[ScoreboardTrigger], None]]] = []
         self._running = False
         self._task: asyncio.Task | None = None
         
     def subscribe(self, callback: Callable[[ScoreboardTrigger], None]):
         """Subscribe to trigger events."""
-        self._subscribers.append(callback)
+        self._subscribers.append((asyncio.iscoroutinefunction(callback), callback))
         
     async def start(self):
         """Start the monitoring process."""
@@ -77,18 +78,17 @@ class ScoreboardMonitor:
             "type": trigger.trigger_type,
             "event": trigger.event_id
         })
-        for callback in self._subscribers:
+        for is_coro, callback in self._subscribers:
             try:
                 # Strategies receive the trigger in the same thread (async callback)
                 # Should be fast to avoid blocking the monitor
-                asyncio.create_task(self._safe_dispatch(callback, trigger))
+                asyncio.create_task(self._safe_dispatch(is_coro, callback, trigger))
             except Exception:
                 pass
                 
-    async def _safe_dispatch(self, callback, trigger):
+    async def _safe_dispatch(self, is_coro, callback, trigger):
         try:
-            # Check if it's a coroutine
-            if asyncio.iscoroutinefunction(callback):
+            if is_coro:
                 await callback(trigger)
             else:
                 callback(trigger)
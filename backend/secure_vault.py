@@ -6,10 +6,12 @@ AES-GCM encryption with PBKDF2 key derivation.
 
 import os
 import json
+import mmap
 import secrets
+from contextlib import contextmanager
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterator
 from datetime import datetime
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
@@ -17,6 +19,13 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.backends import default_backend
 
+try:
+    import orjson
+    # Parses the decrypted bytes directly, no intermediate str
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 
 # Constants
 SALT_SIZE = 32
@@ -153,43 +162,43 @@ class SecureVault:
             raise VaultNotFoundError(f"Vault not found: {self._vault_path}")
         
         try:
-            vault_content = self._vault_path.read_bytes()
-            
-            # Parse header
-            if self.HEADER_SEPARATOR not in vault_content:
-                raise VaultCorruptedError("Invalid vault format")
-            
-            header_bytes, encrypted_part = vault_content.split(self.HEADER_SEPARATOR, 1)
-            
-            # Validate header
-            try:
-                header = json.loads(header_bytes.decode('utf-8'))
-                if header.get("version") != self.VAULT_VERSION:
-                    raise VaultCorruptedError("Unsupported vault version")
-            except json.JSONDecodeError:
-                raise VaultCorruptedError("Invalid vault header")
-            
-            # Extract salt, nonce, and ciphertext
-            if len(encrypted_part) < SALT_SIZE + NONCE_SIZE + 16:  # 16 = min GCM tag
-                raise VaultCorruptedError("Vault data too short")
-            
-            salt = encrypted_part[:SALT_SIZE]
-            nonce = encrypted_part[SALT_SIZE:SALT_SIZE + NONCE_SIZE]
-            ciphertext = encrypted_part[SALT_SIZE + NONCE_SIZE:]
-            
-            # Derive key and decrypt
-            key = self._derive_key(master_password, salt)
-            
-            try:
-                aesgcm = AESGCM(key)
-                plaintext = aesgcm.decrypt(nonce, ciphertext, None)
-            except Exception:
-                self._secure_clear(key)
-                raise VaultDecryptionError("Decryption failed - wrong password or corrupted vault")
+            with self._map_vault() as vault_map:
+                # Parse header
+                separator_at = vault_map.find(self.HEADER_SEPARATOR)
+                if separator_at < 0:
+                    raise VaultCorruptedError("Invalid vault format")
+                
+                # Validate header
+                try:
+                    header = json_loads(vault_map[:separator_at])
+                    if header.get("version") != self.VAULT_VERSION:
+                        raise VaultCorruptedError("Unsupported vault version")
+                except json.JSONDecodeError:
+                    raise VaultCorruptedError("Invalid vault header")
+                
+                # Extract salt, nonce, and ciphertext
+                data_start = separator_at + len(self.HEADER_SEPARATOR)
+                if len(vault_map) - data_start < SALT_SIZE + NONCE_SIZE + 16:  # 16 = min GCM tag
+                    raise VaultCorruptedError("Vault data too short")
+                
+                salt = vault_map[data_start:data_start + SALT_SIZE]
+                nonce = vault_map[data_start + SALT_SIZE:data_start + SALT_SIZE + NONCE_SIZE]
+                
+                # Derive key and decrypt; the ciphertext is handed to AES-GCM
+                # as a view on the mapping, never copied into a bytes object
+                key = self._derive_key(master_password, salt)
+                
+                with memoryview(vault_map) as view, view[data_start + SALT_SIZE + NONCE_SIZE:] as ciphertext:
+                    try:
+                        aesgcm = AESGCM(key)
+                        plaintext = aesgcm.decrypt(nonce, ciphertext, None)
+                    except Exception:
+                        self._secure_clear(key)
+                        raise VaultDecryptionError("Decryption failed - wrong password or corrupted vault")
             
             # Parse credentials
             try:
-                data = json.loads(plaintext.decode('utf-8'))
+                data = json_loads(plaintext)
                 credentials = data.get("credentials", {})
             except json.JSONDecodeError:
                 self._secure_clear(key)
@@ -207,6 +216,28 @@ class SecureVault:
         except Exception as e:
             raise VaultCorruptedError(f"Vault read error: {e}")
     
+    @contextmanager
+    def _map_vault(self) -> Iterator[mmap.mmap]:
+        """
+        Map the vault file read-only for the duration of the block.
+        
+        Saves the read() copy of the whole file; the mapping is released
+        (and the ciphertext pages dropped) as soon as decryption is done.
+        """
+        fd = os.open(self._vault_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            # Zero-length files cannot be mapped; they are simply not vaults
+            if os.fstat(fd).st_size == 0:
+                raise VaultCorruptedError("Invalid vault format")
+            vault_map = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        
+        try:
+            yield vault_map
+        finally:
+            vault_map.close()
+    
     def exists(self) -> bool:
         """Check if vault file exists."""
         return self._vault_path.exists()
@@ -94,14 +94,16 @@ class StrategyAFrontRunning(BaseStrategy):
         self._book_cache_ttl = getattr(config, 'orderbook_cache_ttl_ms', 150) / 1000.0
 
         # v2.5: Dynamic exit configuration
-        self._exit_config = getattr(config, 'exit_config', None) or {
+        # Config dicts are copied: the update_*_config methods edit them in
+        # place, and ConfigLoader shares cached BotConfig instances
+        self._exit_config = dict(getattr(config, 'exit_config', None) or {
             'profit_target_pct': 2.0,      # Exit at +2% profit
             'stop_loss_pct': 1.0,          # Exit at -1% loss
             'trailing_stop_pct': 0.5,      # Trail by 0.5% from high
             'max_hold_seconds': 120,       # Maximum 2 minutes hold
             'min_hold_seconds': 5,         # Minimum 5 seconds before exit
             'exit_mode': 'dynamic'         # 'dynamic', 'fixed', or 'hybrid'
-        }
+        })
 
         # v2.5: Performance tracking
         self._total_trades = 0
@@ -463,14 +465,14 @@ class StrategyAFrontRunning(BaseStrategy):
         scoreboard_trigger = ScoreboardTrigger(
             event_id=trigger.trigger_id,
             token_id=trigger.token_id,
-            trigger_type=trigger.trigger_type.value,
+            trigger_type=trigger.trigger_type.label,
             details=trigger.details,
             timestamp=trigger.timestamp
         )
 
         await self._pending_triggers.put(scoreboard_trigger)
         self._audit.log_strategy_event(self._name, "FEED_TRIGGER_RECEIVED", {
-            "type": trigger.trigger_type.value,
+            "type": trigger.trigger_type.label,
             "confidence": trigger.confidence,
             "direction": trigger.direction
         })
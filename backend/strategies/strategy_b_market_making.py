@@ -88,7 +88,9 @@ class StrategyBMarketMaking(BaseStrategy):
         self._pending_orders: list[str] = []
 
         # v2.5: Dynamic spread configuration
-        self._spread_config = getattr(config, 'spread_config', None) or {
+        # Config dicts are copied: the update_*_config methods edit them in
+        # place, and ConfigLoader shares cached BotConfig instances
+        self._spread_config = dict(getattr(config, 'spread_config', None) or {
             'base_spread': 0.02,              # 2% base spread
             'min_spread': 0.005,              # 0.5% minimum spread
             'max_spread': 0.10,               # 10% maximum spread
@@ -96,26 +98,26 @@ class StrategyBMarketMaking(BaseStrategy):
             'inventory_skew_max': 0.005,      # Maximum 0.5% inventory skew
             'imbalance_factor': 0.001,        # Imbalance-based shift
             'reprice_threshold': 0.005        # 0.5% deviation triggers reprice
-        }
+        })
 
         # v2.5: Multi-market configuration
-        self._market_config = getattr(config, 'market_config', None) or {
+        self._market_config = dict(getattr(config, 'market_config', None) or {
             'max_markets': 50,                # Maximum markets to monitor
             'discovery_interval': 30,         # Seconds between market discovery
             'min_volume_24h': 1000,           # Minimum 24h volume in USD
             'min_spread_opportunity': 0.01,   # Minimum spread to be profitable
             'parallel_reconcile': True        # Process markets in parallel
-        }
+        })
 
         # v3.2: Exit configuration for position management
-        self._exit_config = getattr(config, 'exit_config', None) or {
+        self._exit_config = dict(getattr(config, 'exit_config', None) or {
             'profit_target_pct': 1.5,         # Exit at +1.5% profit
             'stop_loss_pct': 1.0,             # Exit at -1% loss
             'trailing_stop_pct': 0.5,         # 0.5% trailing from high
             'max_hold_seconds': 300,          # 5 minutes max hold
             'min_hold_seconds': 10,           # 10s minimum before exit
             'exit_mode': 'dynamic'            # 'dynamic', 'fixed', or 'hybrid'
-        }
+        })
 
         # v2.5: Performance tracking
         self._total_pnl = 0.0
@@ -376,11 +378,8 @@ class StrategyBMarketMaking(BaseStrategy):
         state = self._market_states[market_id]
 
         # 1. Calculate Dynamic Spread
-        bids = book.bids[:5]
-        asks = book.asks[:5]
-
-        bid_vol = sum(float(b[1]) for b in bids)
-        ask_vol = sum(float(a[1]) for a in asks)
+        bid_vol = book.bid_volume_top5
+        ask_vol = book.ask_volume_top5
         total_vol = bid_vol + ask_vol
 
         # Orderbook imbalance
@@ -0,0 +1,33 @@
+"""
+Tests for AnalyticsEngine's cached summary.
+"""
+
+from unittest.mock import MagicMock
+
+from backend.analytics_engine import AnalyticsEngine
+
+
+def test_mutating_a_summary_does_not_corrupt_the_cache():
+    engine = AnalyticsEngine(MagicMock(), initial_capital=1000.0)
+    engine.record_trade("T1", "Strategy_A", 0.40, 0.50, 100, 30)
+
+    first = engine.get_summary()
+    first['total_pnl'] = -1
+    first['strategies']['Strategy_A']['total_pnl'] = -1
+    first['strategies'].pop('Strategy_A')
+
+    second = engine.get_summary()
+    assert second['total_pnl'] == 10.0
+    assert second['strategies']['Strategy_A'] == engine.get_strategy_stats("Strategy_A")
+
+
+def test_recording_a_trade_refreshes_the_summary():
+    engine = AnalyticsEngine(MagicMock(), initial_capital=1000.0)
+    assert engine.get_summary()['total_trades'] == 0
+
+    engine.record_trade("T1", "Strategy_B", 0.50, 0.45, 10, 5)
+
+    summary = engine.get_summary()
+    assert summary['total_trades'] == 1
+    assert summary['losing_trades'] == 1
+    assert set(summary['strategies']) == {"Strategy_B"}
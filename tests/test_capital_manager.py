@@ -0,0 +1,70 @@
+"""
+Tests for CapitalManager micro-unit accounting.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.capital_manager import CapitalAllocationError, CapitalManager
+
+
+@pytest.fixture
+def capital():
+    return CapitalManager(100.0, 50.0, 40.0, MagicMock())
+
+
+def test_repeated_small_locks_are_exact(capital):
+    # 0.1 is not representable in binary: float sums would drift
+    for _ in range(10):
+        assert capital.lock_for_strategy_a(0.1)
+
+    assert capital.locked_a == 1.0
+    assert capital.free == 99.0
+    assert capital.release_all_strategy_a() == 1.0
+    assert capital.free == capital.total == 100.0
+
+
+def test_lock_release_round_trip_leaves_no_residue(capital):
+    assert capital.lock_for_strategy_a(0.3)
+    assert capital.lock_for_strategy_b(0.7)
+    capital.release_from_strategy_a(0.1)
+    capital.release_from_strategy_a(0.2)
+    capital.release_from_strategy_b(0.7)
+
+    state = capital.state
+    assert (state.locked_a, state.locked_b, state.free) == (0.0, 0.0, 100.0)
+
+
+def test_lock_up_to_max_exactly(capital):
+    assert capital.lock_for_strategy_b(39.9)
+    assert capital.lock_for_strategy_b(0.1)
+    assert capital.locked_b == capital.max_b
+    assert not capital.lock_for_strategy_b(0.000001)
+
+
+def test_free_capital_is_shared_between_pools(capital):
+    assert capital.lock_for_strategy_a(50.0)
+    assert capital.lock_for_strategy_b(40.0)
+    assert capital.free == 10.0
+    assert not capital.lock_for_strategy_a(0.01)
+
+
+def test_release_more_than_locked_raises(capital):
+    assert capital.lock_for_strategy_a(1.0)
+    with pytest.raises(CapitalAllocationError):
+        capital.release_from_strategy_a(1.000001)
+    assert capital.locked_a == 1.0
+
+
+def test_non_positive_amounts_raise(capital):
+    with pytest.raises(CapitalAllocationError):
+        capital.lock_for_strategy_a(0)
+    with pytest.raises(CapitalAllocationError):
+        capital.release_from_strategy_b(-1.0)
+
+
+def test_freeze_blocks_new_locks(capital):
+    capital.freeze_all()
+    assert not capital.lock_for_strategy_a(1.0)
+    assert capital.max_a == capital.max_b == 0.0
@@ -0,0 +1,53 @@
+"""
+Tests for ConfigLoader memoization by (path, mtime, size).
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from backend.config_loader import ConfigLoader
+
+EXAMPLE = Path(__file__).resolve().parent.parent / "config" / "config.example.json"
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    ConfigLoader._cache.clear()
+    path = tmp_path / "config.json"
+    shutil.copy(EXAMPLE, path)
+    yield path
+    ConfigLoader._cache.clear()
+
+
+def test_unchanged_file_shares_the_cached_config(config_file):
+    first = ConfigLoader().load(str(config_file))
+    second = ConfigLoader().load(str(config_file))
+
+    assert second == first
+    assert second.capital is first.capital
+    assert second.file_path == str(config_file)
+
+
+def test_file_path_follows_the_caller(config_file, monkeypatch):
+    ConfigLoader().load(str(config_file))
+    monkeypatch.chdir(config_file.parent)
+
+    assert ConfigLoader().load(config_file.name).file_path == config_file.name
+
+
+def test_rewritten_file_is_reloaded(config_file):
+    first = ConfigLoader().load(str(config_file))
+    data = json.loads(config_file.read_text())
+    data['capital']['total'] = 20000
+    config_file.write_text(json.dumps(data))
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = ConfigLoader().load(str(config_file))
+
+    assert first.capital.total == 10000
+    assert second.capital.total == 20000
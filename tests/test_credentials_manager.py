@@ -0,0 +1,89 @@
+"""
+Tests for CredentialsManager secret reads racing lock/destroy wipes.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.credentials_manager import CredentialsManager
+
+SECRETS = {
+    'api_key': 'key-123',
+    'api_secret': 'secret-456',
+    'api_passphrase': 'pass-789',
+    'api_private_key': '0xwallet',
+}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    cm = CredentialsManager(MagicMock(), str(tmp_path / "credentials.vault"))
+    ok, message = cm.create_vault(
+        SECRETS['api_private_key'], SECRETS['api_key'],
+        SECRETS['api_secret'], SECRETS['api_passphrase'], "master-password"
+    )
+    assert ok, message
+    ok, message = cm.unlock_vault("master-password")
+    assert ok, message
+    return cm
+
+
+def test_getters_return_secrets_while_unlocked(manager):
+    assert manager.get_polymarket_credentials() == SECRETS
+    assert manager.get_wallet_private_key() == SECRETS['api_private_key']
+
+
+@pytest.mark.parametrize("wipe", ["lock_vault", "destroy_credentials"])
+def test_wipe_zeroes_buffers_and_getters_return_none(manager, wipe):
+    buffers = [value for value in manager._credentials if value is not None]
+
+    getattr(manager, wipe)()
+
+    assert all(not any(buffer) for buffer in buffers)
+    assert manager.get_polymarket_credentials() is None
+    assert manager.get_wallet_private_key() is None
+
+
+@pytest.mark.parametrize("wipe", ["lock_vault", "destroy_credentials"])
+def test_wipe_waits_for_an_in_flight_read(manager, monkeypatch, wipe):
+    reveal = CredentialsManager._reveal
+    wiper = threading.Thread(target=getattr(manager, wipe))
+    blocked = []
+
+    def reveal_then_race(value):
+        # Start the wipe mid-read: it must block until the getter is done
+        if not wiper.is_alive() and not blocked:
+            wiper.start()
+            wiper.join(timeout=0.2)
+            blocked.append(wiper.is_alive())
+        return reveal(value)
+
+    monkeypatch.setattr(CredentialsManager, "_reveal", staticmethod(reveal_then_race))
+
+    assert manager.get_polymarket_credentials() == SECRETS
+    assert blocked == [True]
+    wiper.join(timeout=5)
+    assert not wiper.is_alive()
+    assert manager.get_polymarket_credentials() is None
+
+
+def test_concurrent_reads_never_see_wiped_bytes(manager):
+    results = []
+    stop = threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            results.append(manager.get_polymarket_credentials())
+
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in readers:
+        thread.start()
+    manager.lock_vault()
+    stop.set()
+    for thread in readers:
+        thread.join(timeout=5)
+
+    assert all(result in (SECRETS, None) for result in results)
+    assert manager.get_polymarket_credentials() is None
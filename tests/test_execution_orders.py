@@ -0,0 +1,144 @@
+"""
+Tests for ExecutionEngine live order routing through the CLOB thread pool.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("py_clob_client")
+
+from backend.execution_engine import ExecutionEngine, OrderStatus
+
+PARAMS = {'token_id': "token-yes", 'price': "0.42", 'size': "10", 'side': "buy"}
+
+
+class FakeClobClient:
+    """Records create_and_post_order calls and the thread they ran on."""
+
+    def __init__(self, response=None, error=None, gate=None):
+        self.calls = []
+        self._response = response or {'success': True}
+        self._error = error
+        self._gate = gate
+
+    def create_and_post_order(self, order_args):
+        self.calls.append((order_args, threading.current_thread().name))
+        if self._gate is not None:
+            self._gate.wait(timeout=5)
+        if self._error is not None:
+            raise self._error
+        return self._response
+
+
+def run(client, scenario):
+    """Run scenario(engine) on a loop with a live engine wired to client."""
+    async def main():
+        engine = ExecutionEngine(MagicMock())
+        engine._enabled = True
+        engine._exec_sem = asyncio.Semaphore(engine.MAX_CONCURRENT_ORDERS)
+        engine._clob_client = client
+        engine._clob_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="clob")
+        try:
+            return await scenario(engine)
+        finally:
+            engine._clob_pool.shutdown(wait=True)
+    return asyncio.run(main())
+
+
+def test_order_is_posted_from_the_clob_pool():
+    client = FakeClobClient(response={'orderID': "0xabc"})
+    seen = []
+
+    async def scenario(engine):
+        engine.subscribe_status(lambda order: seen.append(order.status))
+        order_id = engine.submit_order("TEST", "LIMIT", PARAMS)
+        assert await engine._execute_order(order_id)
+        return engine, engine.get_order(order_id)
+
+    engine, order = run(client, scenario)
+
+    [(args, thread_name)] = client.calls
+    assert thread_name.startswith("clob")
+    assert (args.token_id, args.price, args.size, args.side) == ("token-yes", 0.42, 10.0, "BUY")
+    assert order.status is OrderStatus.COMPLETED
+    assert "0xabc" in order.result['clob_response']
+    assert seen == [OrderStatus.COMPLETED]
+    assert engine.execution_stats['completed'] == 1
+    assert engine.get_pending_orders() == []
+
+
+def test_client_error_fails_the_order():
+    client = FakeClobClient(error=RuntimeError("not enough balance"))
+
+    async def scenario(engine):
+        order_id = engine.submit_order("TEST", "LIMIT", PARAMS)
+        await engine._execute_order(order_id)
+        return engine, engine.get_order(order_id)
+
+    engine, order = run(client, scenario)
+
+    assert order.status is OrderStatus.FAILED
+    assert order.result['error'] == "not enough balance"
+    assert engine.execution_stats['failed'] == 1
+    engine._audit.log_error.assert_called_once()
+
+
+def test_cancel_during_post_records_the_real_outcome():
+    gate = threading.Event()
+    client = FakeClobClient(gate=gate)
+
+    async def scenario(engine):
+        order_id = engine.submit_order("TEST", "LIMIT", PARAMS)
+        task = asyncio.create_task(engine._execute_order(order_id))
+        while not client.calls:
+            await asyncio.sleep(0.001)
+        # The loop stays free while the CLOB call is in flight
+        assert engine.cancel_order(order_id)
+        assert engine.execution_stats['cancelled'] == 1
+        gate.set()
+        await task
+        return engine, engine.get_order(order_id)
+
+    engine, order = run(client, scenario)
+
+    # The post went through, so the order counts as completed, not cancelled
+    assert order.status is OrderStatus.COMPLETED
+    stats = engine.execution_stats
+    assert (stats['completed'], stats['cancelled']) == (1, 0)
+
+
+def test_finished_orders_are_evicted_oldest_first():
+    class SmallEngine(ExecutionEngine):
+        MAX_FINISHED_ORDERS = 3
+
+    engine = SmallEngine(MagicMock())
+    engine._enabled = True
+    finished = [engine.submit_order("TEST", "LIMIT", PARAMS) for _ in range(5)]
+    live = engine.submit_order("TEST", "LIMIT", PARAMS)
+    for order_id in finished:
+        assert engine.cancel_order(order_id)
+
+    assert [engine.get_order(order_id) for order_id in finished[:2]] == [None, None]
+    assert all(engine.get_order(order_id) for order_id in finished[2:])
+    # Live orders are never evicted, and the stats stay cumulative
+    assert engine.get_pending_orders() == [engine.get_order(live)]
+    stats = engine.execution_stats
+    assert (stats['total_orders'], stats['cancelled'], stats['pending']) == (6, 5, 1)
+
+
+def test_full_queue_rejects_without_a_phantom_order():
+    engine = ExecutionEngine(MagicMock())
+    engine._enabled = True
+    engine.configure_api("https://clob.example", paper_trading=True, queue_size=2)
+
+    accepted = [engine.submit_order("TEST", "LIMIT", PARAMS) for _ in range(2)]
+
+    assert engine.submit_order("TEST", "LIMIT", PARAMS) is None
+    assert engine.pending_count == 2
+    assert sorted(order.order_id for order in engine.get_pending_orders()) == accepted
+    assert engine.execution_stats['total_orders'] == 2
+    engine._audit.log_error.assert_called_once_with("QUEUE_FULL", "Order queue is full")
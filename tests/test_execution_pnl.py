@@ -0,0 +1,95 @@
+"""
+Tests for ExecutionEngine FIFO position tracking and realized PnL.
+"""
+
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("py_clob_client")
+
+from backend.execution_engine import ExecutionEngine, Order
+
+TOKEN = "token-yes"
+
+
+@pytest.fixture
+def engine():
+    return ExecutionEngine(MagicMock())
+
+
+def fill(engine, side, price, size, token_id=TOKEN):
+    """Feed one paper fill through the position tracker; returns the result dict."""
+    order = Order(order_id=f"ORD-{side}-{price}-{size}", strategy="TEST",
+                  order_type="LIMIT", params={'token_id': token_id, 'side': side})
+    result = {'executed_price': price, 'fill_size': size}
+    engine._track_position(order, result)
+    return result
+
+
+def test_sell_consumes_oldest_lots_first(engine):
+    fill(engine, 'BUY', 0.40, 10)
+    fill(engine, 'BUY', 0.60, 10)
+
+    result = fill(engine, 'SELL', 0.70, 15)
+
+    # 10 @ 0.40 then 5 @ 0.60
+    assert result['pnl'] == pytest.approx(10 * 0.30 + 5 * 0.10)
+    [left] = engine.open_positions[TOKEN]
+    assert (left.price, left.size) == (0.60, 5)
+    assert engine._pos_size[TOKEN] == pytest.approx(5)
+    assert engine._pos_cost[TOKEN] == pytest.approx(3.0)
+
+
+def test_partial_head_then_exact_close(engine):
+    fill(engine, 'BUY', 0.50, 8)
+    fill(engine, 'SELL', 0.45, 3)
+    result = fill(engine, 'SELL', 0.55, 5)
+
+    assert result['pnl'] == pytest.approx(5 * 0.05)
+    assert engine.total_realized_pnl == pytest.approx(3 * -0.05 + 5 * 0.05)
+    # Flat tokens are dropped rather than kept with rounding residue
+    assert TOKEN not in engine.open_positions
+    assert TOKEN not in engine._pos_size and TOKEN not in engine._pos_cost
+
+
+def test_oversell_only_realizes_held_size(engine):
+    fill(engine, 'BUY', 0.20, 4)
+
+    result = fill(engine, 'SELL', 0.30, 10)
+
+    assert result['pnl'] == pytest.approx(4 * 0.10)
+    assert TOKEN not in engine.open_positions
+
+
+def test_sell_without_position_realizes_nothing(engine):
+    result = fill(engine, 'SELL', 0.50, 5)
+
+    assert result['pnl'] == 0.0
+    assert engine.total_realized_pnl == 0.0
+    assert TOKEN not in engine.realized_pnl_by_token
+
+
+def test_pnl_is_tracked_per_token(engine):
+    fill(engine, 'BUY', 0.30, 10, token_id="a")
+    fill(engine, 'BUY', 0.60, 10, token_id="b")
+    fill(engine, 'SELL', 0.40, 10, token_id="a")
+    fill(engine, 'SELL', 0.50, 10, token_id="b")
+
+    assert engine.realized_pnl_by_token["a"] == pytest.approx(1.0)
+    assert engine.realized_pnl_by_token["b"] == pytest.approx(-1.0)
+    assert engine.total_realized_pnl == pytest.approx(0.0)
+
+
+def test_running_totals_match_open_lots():
+    engine = ExecutionEngine(MagicMock())
+    rng = random.Random(11)
+    for _ in range(2000):
+        side = 'BUY' if rng.random() < 0.5 else 'SELL'
+        fill(engine, side, round(rng.uniform(0.1, 0.9), 3),
+             round(rng.uniform(1, 50), 2), token_id=f"t{rng.randrange(3)}")
+
+    for token_id, lots in engine.open_positions.items():
+        assert engine._pos_size[token_id] == pytest.approx(sum(p.size for p in lots))
+        assert engine._pos_cost[token_id] == pytest.approx(sum(p.size * p.price for p in lots))
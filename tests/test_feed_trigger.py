@@ -0,0 +1,34 @@
+"""
+Tests for FeedTrigger lazily built, display-rounded details.
+"""
+
+from backend.data_feeds.base_feed import FeedTrigger, TriggerType
+from backend.data_feeds.polymarket_feed import _COMPRESSION_DETAILS, _SPIKE_DETAILS
+
+
+def make_trigger(spec, values):
+    return FeedTrigger(
+        trigger_id="PM-1", trigger_type=TriggerType.PRICE_SPIKE_UP, token_id="token-yes",
+        confidence=0.5, urgency=0.8, direction="BUY", expected_move_pct=1.0,
+        source="polymarket", timestamp=0.0, detail_spec=spec, detail_values=values
+    )
+
+
+def test_details_are_rounded_per_spec():
+    trigger = make_trigger(_SPIKE_DETAILS, ((0.1 + 0.2) * 100, 0.3, 0.39, 60))
+
+    assert trigger.details == {
+        'price_change_pct': 30.0,
+        'old_price': 0.3,
+        'new_price': 0.39,
+        'window_seconds': 60,
+    }
+
+
+def test_details_keep_raw_values_on_the_trigger():
+    trigger = make_trigger(_COMPRESSION_DETAILS, (1.23456, 2.34567, 47.36))
+
+    assert trigger.details == {
+        'current_spread_pct': 1.235, 'avg_spread_pct': 2.346, 'compression_pct': 47.4
+    }
+    assert trigger.detail_values == (1.23456, 2.34567, 47.36)